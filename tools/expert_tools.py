@@ -19,14 +19,21 @@ the official FPL API and therefore do not require authentication.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
-
-import requests
-import pandas as pd
+import asyncio
+import csv
+import heapq
+import io
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
 
 from utils import fpl_data  # type: ignore
 from server import mcp  # type: ignore
 
+if TYPE_CHECKING:
+    import requests
+
 
 # Mapping of expert display names to their FPL entry IDs.
 # You can extend this dictionary as new experts are added.  Names are
@@ -54,6 +61,90 @@ EXPERTS: Dict[str, int] = {
     "Chunkz": 2253812,
 }
 
+# Lookup tables derived from ``EXPERTS`` for resolving user input.
+_EXPERTS_LOWER: Dict[str, Tuple[str, int]] = {k.lower(): (k, v) for k, v in EXPERTS.items()}
+_EXPERTS_BY_ID: Dict[int, str] = {v: k for k, v in EXPERTS.items()}
+
+
+# Shared HTTP session so that repeated calls to the FPL API reuse pooled
+# keep-alive connections instead of opening a new TLS connection each time.
+# It is built on first use so that loading the server doesn't pay for the
+# HTTP stack until an expert tool is actually called.
+_SESSION: Optional["requests.Session"] = None
+
+
+def _session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers["User-Agent"] = "fpl-mcp/1.0"
+        session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+        _SESSION = session
+    return _SESSION
+
+
+# Typed view of the picks endpoint, holding only the fields the tools use.
+class Pick(NamedTuple):
+    element: Optional[int] = None
+    position: int = 0
+    multiplier: int = 1
+
+
+class Picks(NamedTuple):
+    picks: List[Pick] = []
+    active_chip: Optional[str] = None
+
+
+def _as_picks(data: Dict[str, object]) -> Picks:
+    """Build a :class:`Picks` instance from a decoded picks payload."""
+    return Picks(
+        [
+            Pick(p.get("element"), p.get("position", 0), p.get("multiplier", 1))
+            for p in data.get("picks") or []
+        ],
+        data.get("active_chip"),
+    )
+
+
+# Manager histories can still move during a gameweek, so they only live in
+# memory for a short time.  Entries map to ``(expires_at, payload)`` with
+# ``expires_at`` measured on the ``time.monotonic()`` clock.  Picks are
+# cached by ``fpl_data.get_entry_picks``.
+_HISTORY_TTL = 60.0
+_HISTORY_CACHE: Dict[int, Tuple[float, Dict[str, object]]] = {}
+
+# Flat element id → (full name, team name, position, now_cost) mapping
+# used by the hot per-pick lookups, avoiding pandas label indexing.
+_PLAYERS_BY_ID: Optional[Dict[int, Tuple[str, str, str, int]]] = None
+
+
+def _players_by_id() -> Dict[int, Tuple[str, str, str, int]]:
+    """Return a cached mapping of element id to basic player details.
+
+    Each value is a ``(full_name, team_name, position, now_cost)`` tuple.
+    """
+    global _PLAYERS_BY_ID
+    if _PLAYERS_BY_ID is None:
+        df = fpl_data.get_elements_indexed()
+        _PLAYERS_BY_ID = {
+            int(r.id): (f"{r.first_name} {r.second_name}", r.team_name, r.position, r.now_cost)
+            for r in df.itertuples(index=False)
+        }
+    return _PLAYERS_BY_ID
+
+
+def _invalidate() -> None:
+    """Drop the cached players mapping so it is rebuilt on next use."""
+    global _PLAYERS_BY_ID
+    _PLAYERS_BY_ID = None
+
+
+fpl_data.register_refresh_hook(_invalidate)
+
 
 def _resolve_expert(name_or_id: str) -> Optional[Tuple[str, int]]:
     """Resolve an expert name or numeric string to a (name, id) tuple.
@@ -65,53 +156,53 @@ def _resolve_expert(name_or_id: str) -> Optional[Tuple[str, int]]:
         A tuple of the canonical display name and numeric entry id, or None if
         no match is found.
     """
-    # Try numeric conversion first
-    try:
-        num = int(name_or_id)
-        # Find matching name in the EXPERTS mapping if possible
-        for n, i in EXPERTS.items():
-            if i == num:
-                return n, i
-        return str(num), num
-    except Exception:
-        # Lookup by case‑insensitive name
-        lookup = {k.lower(): (k, v) for k, v in EXPERTS.items()}
-        return lookup.get(name_or_id.strip().lower())
+    s = name_or_id.strip()
+    # Lookup by case‑insensitive name first; names are the common input
+    hit = _EXPERTS_LOWER.get(s.lower())
+    if hit:
+        return hit
+    digits = s[1:] if s[:1] == "-" else s
+    if digits.isdecimal():
+        num = int(s)
+        # Use the canonical expert name if the id is a known expert
+        return _EXPERTS_BY_ID.get(num, str(num)), num
+    return None
 
 
 def _get_current_gameweek() -> int:
-    """Return the current gameweek number according to the bootstrap data.
+    """Return the current gameweek number according to the bootstrap data."""
+    return fpl_data.get_current_gameweek()
 
-    If the current gameweek cannot be determined (e.g. off‑season), returns 1.
-    """
-    data = fpl_data.get_bootstrap_data(force_refresh=False)
-    events = data.get("events", [])
-    # Look for the current event
-    for event in events:
-        if event.get("is_current"):
-            return int(event.get("id"))
-    # If no current event, use the next event
-    for event in events:
-        if event.get("is_next"):
-            return int(event.get("id"))
-    # Fall back to the first event
-    return 1
-
-
-def _fetch_team_picks(manager_id: int, gw: int) -> Dict[str, object]:
-    """Fetch the picks for a manager in a given gameweek.
+
+async def _gather_team_picks(
+    names_ids: Sequence[Tuple[str, int]], gw: int
+) -> List[Union[Picks, BaseException]]:
+    """Fetch picks for several managers concurrently.
+
+    Cached picks are reused; only cache misses hit the network.
 
     Args:
-        manager_id: The FPL entry ID of the manager.
+        names_ids: Sequence of ``(name, entry_id)`` tuples.
         gw: Gameweek number (1–38).
 
     Returns:
-        A JSON dictionary with the picks and chip usage.
+        A list aligned with ``names_ids`` holding either the decoded picks
+        or the exception raised while fetching or decoding them.
     """
-    url = f"https://fantasy.premierleague.com/api/entry/{manager_id}/event/{gw}/picks/"
-    resp = requests.get(url)
-    resp.raise_for_status()
-    return resp.json()
+    results: List = [fpl_data.cached_entry_picks(eid, gw) for _, eid in names_ids]
+    missing = [i for i, data in enumerate(results) if data is None]
+    if missing:
+        import httpx
+
+        limits = httpx.Limits(max_connections=32)
+        async with httpx.AsyncClient(limits=limits, timeout=10) as client:
+            fetched = await asyncio.gather(
+                *[fpl_data.get_entry_picks_async(client, names_ids[i][1], gw) for i in missing],
+                return_exceptions=True,
+            )
+        for i, data in zip(missing, fetched):
+            results[i] = data
+    return [r if isinstance(r, BaseException) else _as_picks(r) for r in results]
 
 
 def _fetch_transfers(manager_id: int) -> List[Dict[str, object]]:
@@ -125,7 +216,7 @@ def _fetch_transfers(manager_id: int) -> List[Dict[str, object]]:
         ``element_in``, ``element_out``, ``event`` and ``time``.
     """
     url = f"https://fantasy.premierleague.com/api/entry/{manager_id}/transfers/"
-    resp = requests.get(url)
+    resp = _session().get(url, timeout=10)
     resp.raise_for_status()
     return resp.json()  # type: ignore[return-value]
 
@@ -133,20 +224,61 @@ def _fetch_transfers(manager_id: int) -> List[Dict[str, object]]:
 def _fetch_manager_history(manager_id: int) -> Dict[str, object]:
     """Fetch the historical performance of a manager.
 
+    Responses are cached in memory for ``_HISTORY_TTL`` seconds.
+
     Args:
         manager_id: The FPL entry ID of the manager.
 
     Returns:
         A JSON dictionary with keys such as ``current``, ``past`` and ``chips``.
     """
+    entry = _HISTORY_CACHE.get(manager_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
     url = f"https://fantasy.premierleague.com/api/entry/{manager_id}/history/"
-    resp = requests.get(url)
+    resp = _session().get(url, timeout=10)
     resp.raise_for_status()
-    return resp.json()  # type: ignore[return-value]
+    data = resp.json()
+    _HISTORY_CACHE[manager_id] = (time.monotonic() + _HISTORY_TTL, data)
+    return data  # type: ignore[return-value]
+
+
+def _fetch_manager_histories(
+    manager_ids: Sequence[int],
+) -> List[Union[Dict[str, object], BaseException]]:
+    """Fetch the histories of several managers in parallel.
+
+    The requests are I/O bound, so they are overlapped on a small thread
+    pool sharing the module's pooled session.
+
+    Args:
+        manager_ids: FPL entry IDs of the managers.
+
+    Returns:
+        A list aligned with ``manager_ids`` holding either the history
+        payload or the exception raised while fetching it.
+    """
+
+    def fetch(mid: int) -> Union[Dict[str, object], BaseException]:
+        try:
+            return _fetch_manager_history(mid)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        return list(ex.map(fetch, manager_ids))
+
+
+# Row layout for get_expert_teams_summary: player, team, position, price, owners
+_SUMMARY_ROW_FMT = "%-25s %-20s %-4s %-5.1f %s"
 
 
 @mcp.tool()
-def get_expert_teams_summary(gw: Optional[int] = None, experts: Optional[List[str]] = None) -> str:
+async def get_expert_teams_summary(
+    gw: Optional[int] = None,
+    experts: Optional[List[str]] = None,
+    format: Literal["table", "csv"] = "table",
+) -> str:
     """Summarise which players are currently owned by selected experts.
 
     Given a list of expert names (or None for all) and an optional gameweek,
@@ -160,6 +292,8 @@ def get_expert_teams_summary(gw: Optional[int] = None, experts: Optional[List[st
             is used (determined from the bootstrap data).
         experts: Optional list of expert names or entry IDs to include.  If
             None, all experts in the mapping are used.
+        format: ``"table"`` for an aligned text table or ``"csv"`` for CSV
+            with one row per player.
 
     Returns:
         A multi‑line string summarising player ownership across the experts.
@@ -177,49 +311,42 @@ def get_expert_teams_summary(gw: Optional[int] = None, experts: Optional[List[st
         names_ids = list((name, eid) for name, eid in EXPERTS.items())
     if not names_ids:
         return "No experts found. Please provide valid names or IDs."
-    # Load elements dataframe for id→name mapping
-    elements_df = fpl_data.get_elements_df()
-    elements_df = elements_df.set_index("id")
-    # Build a mapping of player id → list of expert names who own them
-    ownership: Dict[int, List[str]] = {}
-    for name, eid in names_ids:
-        try:
-            data = _fetch_team_picks(eid, gameweek)
-        except Exception:
+    # Cached id → player details mapping
+    players = _players_by_id()
+    # Fetch every expert's picks concurrently rather than one after another
+    results = await _gather_team_picks(names_ids, gameweek)
+    # Build a mapping of player id → indices (into names_ids) of the
+    # experts who own them; names are resolved once per output row
+    ownership: Dict[int, List[int]] = defaultdict(list)
+    for idx, data in enumerate(results):
+        if isinstance(data, BaseException):
             continue  # Skip if fetch fails
-        picks = data.get("picks", [])
-        for pick in picks:
-            elem_id = pick.get("element")
+        for pick in data.picks:
+            elem_id = pick.element
             if elem_id is None:
                 continue
-            ownership.setdefault(elem_id, []).append(name)
+            ownership[elem_id].append(idx)
     if not ownership:
         return f"No picks found for the selected experts in gameweek {gameweek}."
-    # Build rows with player info and owners
-    rows = []
-    for pid, owners in ownership.items():
-        if pid not in elements_df.index:
-            continue
-        player = elements_df.loc[pid]
-        rows.append({
-            "player_name": f"{player['first_name']} {player['second_name']}",
-            "team": player.get("team_name", ""),
-            "position": player.get("position", ""),
-            "price_m": player.get("now_cost", 0) / 10.0,
-            "owned_by": ", ".join(sorted(owners)),
-            "count": len(owners),
-        })
+    # Build (count, player, team, position, price, owners) rows in one pass
+    rows = [
+        (len(owners), p[0], p[1], p[2], p[3] / 10.0, ", ".join(sorted(names_ids[i][0] for i in owners)))
+        for pid, owners in ownership.items()
+        if (p := players.get(pid)) is not None
+    ]
     # Sort by number of owners descending then by player name
-    rows.sort(key=lambda r: (-r["count"], r["player_name"]))
+    rows.sort(key=lambda r: (-r[0], r[1]))
+    if format == "csv":
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["player", "team", "position", "price_m", "owned_by", "count"])
+        writer.writerows(r[1:] + r[:1] for r in rows)
+        return buf.getvalue()
     # Build output string
     header = f"Expert ownership summary for GW{gameweek}:\n"
     header += f"{'Player':<25} {'Team':<20} {'Pos':<4} {'Price':<5} Owned by\n"
     header += "-" * 80 + "\n"
-    lines = []
-    for r in rows:
-        lines.append(
-            f"{r['player_name']:<25} {r['team']:<20} {r['position']:<4} {r['price_m']:<5.1f} {r['owned_by']}"
-        )
+    lines = [_SUMMARY_ROW_FMT % r[1:] for r in rows]
     return header + "\n".join(lines)
 
 
@@ -250,17 +377,31 @@ def get_expert_transfers(expert: str, last_n: int = 5) -> str:
         return f"Failed to fetch transfers for {name}: {e}"
     if not transfers:
         return f"No transfers recorded for {name} this season."
-    # Load elements for name lookup
-    elements_df = fpl_data.get_elements_df().set_index("id")
-    # Sort transfers by time descending (ISO timestamps) and take last_n
-    transfers_sorted = sorted(transfers, key=lambda t: t.get("time", ""), reverse=True)[:last_n]
+    # Cached, id-indexed elements for name lookup
+    elements_df = fpl_data.get_elements_indexed()
+    # Take the last_n most recent transfers by time (ISO timestamps).
+    # nlargest matches sorted(..., reverse=True)[:last_n] only for
+    # non-negative counts, so a negative one keeps the slice.
+    if last_n >= 0:
+        transfers_sorted = heapq.nlargest(last_n, transfers, key=lambda t: t.get("time", ""))
+    else:
+        transfers_sorted = sorted(transfers, key=lambda t: t.get("time", ""), reverse=True)[:last_n]
+    # Resolve every player involved with a single vectorised lookup; ids
+    # missing from the elements table simply have no entry in ``lookup``.
+    ids = {t.get("element_in") for t in transfers_sorted} | {t.get("element_out") for t in transfers_sorted}
+    ids.discard(None)
+    lookup = (
+        elements_df.reindex(list(ids))[["first_name", "second_name", "now_cost"]]
+        .dropna(how="all")
+        .to_dict("index")
+    )
     lines = [f"Latest {min(last_n, len(transfers_sorted))} transfers for {name}:"]
     for tr in transfers_sorted:
         gw = tr.get("event")
         in_id = tr.get("element_in")
         out_id = tr.get("element_out")
-        player_in = elements_df.loc.get(in_id)
-        player_out = elements_df.loc.get(out_id)
+        player_in = lookup.get(in_id)
+        player_out = lookup.get(out_id)
         in_name = f"{player_in['first_name']} {player_in['second_name']}" if player_in is not None else str(in_id)
         out_name = f"{player_out['first_name']} {player_out['second_name']}" if player_out is not None else str(out_id)
         in_price = (player_in["now_cost"] / 10.0) if player_in is not None else 0.0
@@ -312,14 +453,65 @@ def get_manager_history(manager: str) -> str:
     # Current season scores
     current = history.get("current", [])
     if current:
-        # Compute total points and average score
-        total_points = sum(ev.get("points", 0) for ev in current)
-        avg_points = total_points / len(current)
-        highest = max(current, key=lambda ev: ev.get("points", 0))
+        # Compute total, count and highest score in a single pass
+        total_points = n_gameweeks = 0
+        highest = None
+        high_score = 0
+        for ev in current:
+            pts = ev.get("points", 0)
+            total_points += pts
+            n_gameweeks += 1
+            if highest is None or pts > high_score:
+                highest, high_score = ev, pts
+        avg_points = total_points / n_gameweeks
         high_gw = highest.get("event")
         high_points = highest.get("points")
         output_lines.append(
-            f"Current season: {len(current)} gameweeks, total {total_points} pts, "
+            f"Current season: {n_gameweeks} gameweeks, total {total_points} pts, "
             f"average {avg_points:.1f} pts, highest GW{high_gw} with {high_points} pts."
         )
-    return "\n".join(output_lines)
\ No newline at end of file
+    return "\n".join(output_lines)
+
+
+@mcp.tool()
+def get_expert_leaderboard(experts: Optional[List[str]] = None) -> str:
+    """Rank experts by their total points in the current season.
+
+    Each manager's history is fetched in parallel and the latest gameweek
+    entry is used for their season total and overall rank.
+
+    Args:
+        experts: Optional list of expert names or entry IDs to include.  If
+            None, all experts in the mapping are used.
+
+    Returns:
+        A table of experts ordered by current season points, highest first.
+    """
+    if experts:
+        names_ids = [r for r in (_resolve_expert(str(ex)) for ex in experts) if r]
+    else:
+        names_ids = list(EXPERTS.items())
+    if not names_ids:
+        return "No experts found. Please provide valid names or IDs."
+    histories = _fetch_manager_histories([eid for _, eid in names_ids])
+    rows = []
+    for (name, _), history in zip(names_ids, histories):
+        if isinstance(history, BaseException):
+            continue  # Skip if fetch fails
+        current = history.get("current") or []
+        if not current:
+            continue
+        latest = current[-1]
+        rows.append(
+            (name, latest.get("total_points", 0), latest.get("overall_rank"), latest.get("event"))
+        )
+    if not rows:
+        return "No current season history found for the selected experts."
+    rows.sort(key=lambda r: -r[1])
+    lines = [f"Expert leaderboard after GW{max(r[3] or 0 for r in rows)}:"]
+    lines.append(f"{'#':<3} {'Expert':<20} {'Points':<7} Overall rank")
+    lines.append("-" * 50)
+    for pos, (name, points, overall_rank, _) in enumerate(rows, 1):
+        rank = f"{overall_rank:,}" if isinstance(overall_rank, int) else "-"
+        lines.append(f"{pos:<3} {name:<20} {points:<7} {rank}")
+    return "\n".join(lines)
@@ -11,8 +11,13 @@ gameweek history.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import base64
+import functools
+import sys
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional
 
+import numpy as np
 import pandas as pd
 
 # Use absolute imports rather than package-relative imports.  When this
@@ -23,9 +28,196 @@ from utils import fpl_data  # type: ignore
 from server import mcp  # type: ignore
 
 
+# The FPL snapshot changes at most a few times per hour, so the enriched
+# tables below are memoised per hour bucket (and dropped early whenever the
+# bootstrap data is refreshed).  The cached frames are shared between calls
+# and must be treated as read-only.
+def _hour_bucket() -> int:
+    return int(time.time() // 3600)
+
+
+def _mark_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Record column metadata used by ``query_fpl_data`` in ``df.attrs``.
+
+    ``colset`` is a frozenset of the column names for constant-time
+    membership checks and ``datetime_cols`` lists the datetime columns to
+    format for display.
+    """
+    df.attrs["colset"] = frozenset(df.columns)
+    df.attrs["datetime_cols"] = tuple(df.select_dtypes(include=["datetime64[ns]"]).columns)
+    return df
+
+
+def _presort(df: pd.DataFrame, col: str, ascending: bool) -> pd.DataFrame:
+    """Sort ``df`` by its default key once, noting the order in ``df.attrs``.
+
+    Boolean filtering keeps row order, so queries using the same order can
+    skip sorting altogether.
+    """
+    if col not in df.columns:
+        return df
+    df = df.sort_values(by=col, ascending=ascending, kind="stable").reset_index(drop=True)
+    df.attrs["sorted_by"] = (col, ascending)
+    return df
+
+
+def _intern_strings(series: pd.Series) -> pd.Series:
+    """Share one ``str`` object per distinct value of an object column.
+
+    Columns backed by a dedicated string dtype are returned unchanged.
+    """
+    if series.dtype != object:
+        return series
+    return series.map(lambda v: sys.intern(v) if isinstance(v, str) else v)
+
+
+@functools.lru_cache(maxsize=1)
+def _players_enriched(bucket: int) -> pd.DataFrame:
+    """Players with team names, positions and a ``price_m`` column."""
+    df = fpl_data.get_elements_df()
+    df["price_m"] = df["now_cost"] / 10.0
+    # Low-cardinality labels are stored as categoricals so comparisons run
+    # on the integer codes
+    for col in ("position", "team_name"):
+        df[col] = df[col].astype("category")
+    for col in ("first_name", "second_name"):
+        df[col] = _intern_strings(df[col])
+    return _mark_columns(_presort(df, "total_points", ascending=False))
+
+
+@functools.lru_cache(maxsize=1)
+def _teams_indexed(bucket: int) -> pd.DataFrame:
+    """Teams indexed by team id (``id`` is kept as a column too)."""
+    df = fpl_data.get_teams_df().set_index("id", drop=False)
+    df["short_name"] = df["short_name"].astype("category")
+    # Interned so that every frame mapped from it shares the name objects
+    df["name"] = _intern_strings(df["name"])
+    return _mark_columns(df)
+
+
+@functools.lru_cache(maxsize=1)
+def _fixtures_enriched(bucket: int) -> pd.DataFrame:
+    """Fixtures with ``team_h_name``/``team_a_name`` resolved from team ids."""
+    df = fpl_data.get_fixtures_df()
+    team_map = _teams_indexed(bucket)["name"]
+    df["team_h_name"] = df["team_h"].map(team_map).astype("category")
+    df["team_a_name"] = df["team_a"].map(team_map).astype("category")
+    return _mark_columns(_presort(df, "kickoff_time", ascending=True))
+
+
+def _clear_caches() -> None:
+    _players_enriched.cache_clear()
+    _teams_indexed.cache_clear()
+    _fixtures_enriched.cache_clear()
+    _query_fpl_data_cached.cache_clear()
+    _team_summary.cache_clear()
+
+
+fpl_data.register_refresh_hook(_clear_caches)
+
+
+# Loader and default display columns for each entity accepted by
+# ``query_fpl_data``.  Columns missing from the data are skipped.
+_ENTITY_LOADERS: Dict[str, Callable[[int], pd.DataFrame]] = {
+    "players": _players_enriched,
+    "fixtures": _fixtures_enriched,
+    "teams": _teams_indexed,
+}
+
+_DISPLAY_COLUMNS: Dict[str, List[str]] = {
+    # "element_type" is preserved so that callers can filter numerically
+    # (1=GKP, 2=DEF, 3=MID, 4=FWD).  "position" holds the string
+    # representation (GKP, DEF, MID, FWD).  Include ``selected_by_percent``
+    # for ownership queries.
+    "players": [
+        "id",
+        "first_name",
+        "second_name",
+        "element_type",
+        "position",
+        "team_name",
+        "price_m",
+        "total_points",
+        "minutes",
+        "goals_scored",
+        "assists",
+        "yellow_cards",
+        "red_cards",
+        "selected_by_percent",
+    ],
+    # Include the fixture id (useful for debugging) and event (gameweek
+    # number).
+    "fixtures": [
+        "id",
+        "event",
+        "kickoff_time",
+        "team_h_name",
+        "team_a_name",
+        "team_h_score",
+        "team_a_score",
+        "finished",
+    ],
+    "teams": [
+        "id",
+        "name",
+        "short_name",
+        "strength_attack_home",
+        "strength_defence_home",
+        "strength_attack_away",
+        "strength_defence_away",
+    ],
+}
+
+
+# Comparison operators accepted in filter conditions, mapped to the NumPy
+# ufuncs that evaluate them.
+_COMPARISONS: Dict[str, np.ufunc] = {
+    "eq": np.equal,
+    "lt": np.less,
+    "lte": np.less_equal,
+    "gt": np.greater,
+    "gte": np.greater_equal,
+}
+
+
+def _compare(series: pd.Series, op: str, value: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Evaluate ``series <op> value`` as a plain boolean array.
+
+    ``out`` is an optional scratch buffer; numeric comparisons are written
+    into it instead of allocating a new array.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Evaluate the condition once per category, then gather the result
+        # for each row by its code; missing values (code -1) pick up the
+        # trailing False.
+        cat_mask = _compare(series.cat.categories.to_series(), op, value)
+        return np.append(cat_mask, False)[series.cat.codes.to_numpy()]
+    if op == "contains":
+        # Plain substring search; the value is not treated as a regex.
+        # String-dtype columns are searched as-is, without an astype copy.
+        if not isinstance(series.dtype, pd.StringDtype):
+            series = series.astype(str)
+        return series.str.contains(str(value), case=False, na=False, regex=False).to_numpy()
+    ufunc = _COMPARISONS.get(op)
+    if ufunc is None:
+        raise ValueError(f"Unsupported operator: {op}")
+    arr = series.to_numpy()
+    # Compare numeric columns against numeric values on the raw array;
+    # anything else goes through pandas, which handles missing values
+    # and mixed object columns.
+    if arr.dtype.kind in "biuf" and isinstance(value, (int, float)):
+        return ufunc(arr, value, out=out)
+    return ufunc(series, value).to_numpy(dtype=bool, na_value=False)
+
+
 def _apply_filters(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
     """Internal helper to apply comparison filters to a DataFrame.
 
+    Every condition is evaluated into a single boolean mask and the frame
+    is sliced once at the end.  After the first condition, results are
+    written to one reusable scratch buffer and AND-ed into the mask in
+    place, so no per-condition arrays are allocated on the numeric path.
+
     Args:
         df: The DataFrame to filter.
         filters: Mapping of column names to either a raw value or
@@ -35,26 +227,182 @@ def _apply_filters(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
     Returns:
         The filtered DataFrame.
     """
+    mask: Optional[np.ndarray] = None
+    scratch: Optional[np.ndarray] = None
     for col, condition in filters.items():
         if isinstance(condition, dict):
-            for op, value in condition.items():
-                if op == "eq":
-                    df = df[df[col] == value]
-                elif op == "lt":
-                    df = df[df[col] < value]
-                elif op == "lte":
-                    df = df[df[col] <= value]
-                elif op == "gt":
-                    df = df[df[col] > value]
-                elif op == "gte":
-                    df = df[df[col] >= value]
-                elif op == "contains":
-                    df = df[df[col].astype(str).str.contains(str(value), case=False, na=False)]
-                else:
-                    raise ValueError(f"Unsupported operator: {op}")
+            conditions = condition.items()
         else:
-            df = df[df[col] == condition]
-    return df
+            conditions = (("eq", condition),)
+        for op, value in conditions:
+            if mask is None:
+                # Seed the mask from the first condition (copied only if
+                # it is a read-only view)
+                mask = np.require(_compare(df[col], op, value), requirements="W")
+                continue
+            if scratch is None:
+                scratch = np.empty(len(df), dtype=bool)
+            np.logical_and(mask, _compare(df[col], op, value, out=scratch), out=mask)
+    if mask is None:
+        return df
+    return df[mask]
+
+
+def _sort_head(df: pd.DataFrame, col: str, ascending: bool, n: Optional[int]) -> pd.DataFrame:
+    """Return the first ``n`` rows of ``df`` ordered by ``col``.
+
+    Ties keep their original order.  When only a small slice of a numeric
+    column is wanted the top rows are selected with a partition, which is
+    linear, and only those rows are sorted.
+
+    Args:
+        df: The DataFrame to sort.
+        col: Column to order by.
+        ascending: Sort direction.
+        n: Number of rows to keep, or None for all of them.
+
+    Returns:
+        The sorted (and truncated) DataFrame.
+    """
+    vals = df[col].to_numpy()
+    if (
+        n is None
+        or n <= 0
+        or n >= len(vals) // 2
+        or vals.dtype.kind not in "if"
+        or (vals.dtype.kind == "f" and np.isnan(vals).any())
+    ):
+        df = df.sort_values(by=col, ascending=ascending, kind="stable")
+        return df if n is None else df.head(n)
+    keys = vals if ascending else -vals
+    # Everything strictly better than the n-th key, plus the earliest rows
+    # tied with it, in original row order
+    kth = np.partition(keys, n - 1)[n - 1]
+    better = np.flatnonzero(keys < kth)
+    ties = np.flatnonzero(keys == kth)[: n - len(better)]
+    idx = np.concatenate((better, ties))
+    return df.iloc[idx[np.argsort(keys[idx], kind="stable")]]
+
+
+def _to_arrow_base64(df: pd.DataFrame) -> str:
+    """Serialise ``df`` as an Arrow IPC stream, base64-encoded for transport."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii")
+
+
+def _freeze_filters(filters: Optional[Dict[str, Any]]) -> tuple:
+    """Convert a filters mapping into a hashable tuple, keeping its order.
+
+    Each value is stored with its type: ``1``, ``1.0`` and ``True`` are
+    equal as cache keys but do not filter alike.
+    """
+    return tuple(
+        (col, True, tuple((op, type(v), v) for op, v in cond.items()))
+        if isinstance(cond, dict)
+        else (col, False, (type(cond), cond))
+        for col, cond in (filters or {}).items()
+    )
+
+
+def _thaw_filters(frozen: tuple) -> Dict[str, Any]:
+    """Inverse of :func:`_freeze_filters`."""
+    return {
+        col: {op: v for op, _, v in cond} if is_ops else cond[1]
+        for col, is_ops, cond in frozen
+    }
+
+
+# Tool results are deterministic for a given data snapshot, so identical
+# calls within the same hour are answered from these caches.  They are
+# cleared together with the enriched frames.
+@functools.lru_cache(maxsize=256, typed=True)
+def _query_fpl_data_cached(
+    entity: str,
+    frozen_filters: tuple,
+    sort_by: Optional[str],
+    sort_order: str,
+    top_n: Optional[int],
+    format: str,
+    bucket: int,
+) -> str:
+    return _query_fpl_data(entity, _thaw_filters(frozen_filters), sort_by, sort_order, top_n, format)
+
+
+def _query_fpl_data(
+    entity: str,
+    filters: Dict[str, Any],
+    sort_by: Optional[str],
+    sort_order: str,
+    top_n: Optional[int],
+    format: str,
+) -> str:
+    """Run a :func:`query_fpl_data` query without result caching."""
+    entity = entity.lower()
+    loader = _ENTITY_LOADERS.get(entity)
+    if loader is None:
+        raise ValueError(f"Unsupported entity: {entity}")
+    df = loader(_hour_bucket())
+    colset = df.attrs["colset"]
+    display_columns = [c for c in _DISPLAY_COLUMNS[entity] if c in colset]
+    # Only datetime columns that are displayed need formatting
+    datetime_cols = [c for c in df.attrs["datetime_cols"] if c in display_columns]
+    presorted = df.attrs.get("sorted_by")
+
+    # Validate filter keys and the sort column up front, against the full
+    # table.  Unknown keys indicate either a mistake in the query or a
+    # missing column.  We return a helpful error listing available fields.
+    if filters:
+        invalid = [col for col in filters if col not in colset]
+        if invalid:
+            available = ", ".join(sorted(df.columns))
+            raise ValueError(
+                f"Unknown filter field(s): {', '.join(invalid)}. Available fields: {available}"
+            )
+    if sort_by and sort_by not in colset:
+        available = ", ".join(sorted(df.columns))
+        raise ValueError(
+            f"Unknown sort field '{sort_by}'. Available fields: {available}"
+        )
+
+    # Project down to the columns the query actually touches before
+    # filtering, so the filter and sort work on a narrow frame.
+    needed = [*display_columns, *(filters or ())]
+    if sort_by:
+        needed.append(sort_by)
+    df = df[list(dict.fromkeys(needed))]
+    if filters:
+        df = _apply_filters(df, filters)
+
+    if not sort_by:
+        # Apply sensible default sorting
+        if entity == "players" and "total_points" in colset:
+            sort_by, sort_order = "total_points", "desc"
+        elif entity == "fixtures" and "kickoff_time" in colset:
+            sort_by, sort_order = "kickoff_time", "asc"
+
+    # Sort and limit rows; the cached frame may already be in the right order
+    if sort_by and (sort_by, sort_order == "asc") != presorted:
+        df = _sort_head(df, sort_by, sort_order == "asc", top_n)
+    elif top_n is not None:
+        df = df.head(top_n)
+
+    # Convert datetime columns to strings for display.  ``assign`` returns a
+    # new frame so the cached table is never modified.
+    if datetime_cols:
+        df = df.assign(**{col: df[col].dt.strftime("%Y-%m-%d %H:%M") for col in datetime_cols})
+
+    # Emit the display columns in their defined order.  The text writers
+    # select them themselves; only the Arrow path needs a projected frame.
+    if format == "csv":
+        return df.to_csv(index=False, columns=display_columns)
+    if format == "arrow":
+        return _to_arrow_base64(df[display_columns])
+    return df.to_string(index=False, columns=display_columns)
 
 
 @mcp.tool()
@@ -64,6 +412,7 @@ def query_fpl_data(
     sort_by: Optional[str] = None,
     sort_order: str = "desc",
     top_n: Optional[int] = 20,
+    format: Literal["table", "csv", "arrow"] = "table",
 ) -> str:
     """Query various FPL entities (players, fixtures, teams).
 
@@ -79,6 +428,9 @@ def query_fpl_data(
             ``kickoff_time`` for fixtures.
         sort_order: "asc" or "desc".
         top_n: Maximum number of rows to return. Use None for all.
+        format: ``"table"`` for an aligned text table, ``"csv"`` for
+            CSV, or ``"arrow"`` for a base64-encoded Arrow IPC stream
+            meant for other programs rather than for reading.
 
     Returns:
         A string containing a formatted table of the query
@@ -118,118 +470,22 @@ def query_fpl_data(
     * ``gte`` – greater than or equal (numeric)
     * ``contains`` – case-insensitive substring search (strings)
     """
-    entity = entity.lower()
-    if entity == "players":
-        # Load player data with team names and positions.  This DataFrame
-        # retains the ``element_type`` column (1–4 for GK, DEF, MID, FWD)
-        # and converts ``selected_by_percent`` to float in
-        # ``fpl_data.get_elements_df``.  We derive a price column
-        # expressed in millions for easier filtering and display.
-        df = fpl_data.get_elements_df()
-        df["price_m"] = df["now_cost"] / 10.0
-        # We'll present a useful subset of columns by default.
-        # "element_type" is preserved so that callers can filter
-        # numerically (1=GKP, 2=DEF, 3=MID, 4=FWD).  "position" holds
-        # the string representation (GKP, DEF, MID, FWD).  Include
-        # ``selected_by_percent`` for ownership queries.
-        display_columns = [
-            "id",
-            "first_name",
-            "second_name",
-            "element_type",
-            "position",
-            "team_name",
-            "price_m",
-            "total_points",
-            "minutes",
-            "goals_scored",
-            "assists",
-            "yellow_cards",
-            "red_cards",
-            "selected_by_percent",
-        ]
-        # Ensure only available columns are selected (in case of API
-        # changes).
-        display_columns = [c for c in display_columns if c in df.columns]
-    elif entity == "fixtures":
-        # Load fixtures and map team IDs to names.  Rather than
-        # merging and dropping the ``id`` column (which can cause
-        # KeyError if ``id`` isn't present), use a mapping.
-        df = fpl_data.get_fixtures_df()
-        teams_df = fpl_data.get_teams_df()[["id", "name"]]
-        team_map = dict(zip(teams_df["id"], teams_df["name"]))
-        df["team_h_name"] = df["team_h"].map(team_map)
-        df["team_a_name"] = df["team_a"].map(team_map)
-        # Define default display columns.  Include the fixture id
-        # (useful for debugging) and event (gameweek number).
-        display_columns = [
-            "id" if "id" in df.columns else None,
-            "event" if "event" in df.columns else None,
-            "kickoff_time" if "kickoff_time" in df.columns else None,
-            "team_h_name",
-            "team_a_name",
-            "team_h_score" if "team_h_score" in df.columns else None,
-            "team_a_score" if "team_a_score" in df.columns else None,
-            "finished" if "finished" in df.columns else None,
-        ]
-        display_columns = [c for c in display_columns if c is not None]
-    elif entity == "teams":
-        df = fpl_data.get_teams_df()
-        display_columns = [
-            "id",
-            "name",
-            "short_name",
-            "strength_attack_home" if "strength_attack_home" in df.columns else None,
-            "strength_defence_home" if "strength_defence_home" in df.columns else None,
-            "strength_attack_away" if "strength_attack_away" in df.columns else None,
-            "strength_defence_away" if "strength_defence_away" in df.columns else None,
-        ]
-        display_columns = [c for c in display_columns if c is not None]
-    else:
-        raise ValueError(f"Unsupported entity: {entity}")
-
-    # Validate filter keys before applying them.  Unknown keys
-    # indicate either a mistake in the query or a missing column.  We
-    # return a helpful error listing available fields.
-    if filters:
-        invalid = [col for col in filters if col not in df.columns]
-        if invalid:
-            available = ", ".join(sorted(df.columns))
-            raise ValueError(
-                f"Unknown filter field(s): {', '.join(invalid)}. Available fields: {available}"
-            )
-        df = _apply_filters(df, filters)
-
-    # Validate sort column if provided
-    if sort_by:
-        if sort_by not in df.columns:
-            available = ", ".join(sorted(df.columns))
-            raise ValueError(
-                f"Unknown sort field '{sort_by}'. Available fields: {available}"
-            )
-        df = df.sort_values(by=sort_by, ascending=(sort_order == "asc"))
-    else:
-        # Apply sensible default sorting
-        if entity == "players" and "total_points" in df.columns:
-            df = df.sort_values(by="total_points", ascending=False)
-        elif entity == "fixtures" and "kickoff_time" in df.columns:
-            df = df.sort_values(by="kickoff_time", ascending=True)
-
-    # Limit rows
-    if top_n is not None:
-        df = df.head(top_n)
-
-    # Convert datetime columns to strings for display
-    for col in df.select_dtypes(include=["datetime64[ns]"]).columns:
-        df[col] = df[col].dt.strftime("%Y-%m-%d %H:%M")
+    try:
+        frozen = _freeze_filters(filters)
+        hash(frozen)
+    except TypeError:
+        # Unhashable filter values (e.g. lists) bypass the result cache
+        return _query_fpl_data(entity, filters, sort_by, sort_order, top_n, format)
+    return _query_fpl_data_cached(
+        entity.lower(), frozen, sort_by, sort_order, top_n, format, _hour_bucket()
+    )
 
-    # Select display columns in the defined order (if defined).  If
-    # ``display_columns`` is not set (which should not happen), fall
-    # back to all columns.
-    if isinstance(locals().get("display_columns"), list) and display_columns:
-        df = df[[col for col in display_columns if col in df.columns]]
 
-    return df.to_string(index=False)
+def _parse_id(value: Any) -> Optional[int]:
+    """Return ``value`` as an int if it is a numeric ID, otherwise None."""
+    s = str(value).strip()
+    digits = s[1:] if s[:1] in ("-", "+") else s
+    return int(s) if digits.isdecimal() else None
 
 
 @mcp.tool()
@@ -247,21 +503,21 @@ def get_team_summary(team: str, last_n_games: int = 5) -> str:
         A multi-line string reporting total games played, wins, draws,
         losses, goals scored, goals conceded and points accumulated.
     """
+    return _team_summary(team, last_n_games, _hour_bucket())
+
+
+@functools.lru_cache(maxsize=256)
+def _team_summary(team: str, last_n_games: int, bucket: int) -> str:
     # Resolve team ID
-    try:
-        team_id = int(team)
-    except Exception:
+    team_id = _parse_id(team)
+    if team_id is None:
         team_id = fpl_data.get_team_id_by_name(str(team))
     if team_id is None:
         return f"Team '{team}' not found."
     summary = fpl_data.compute_team_summary(team_id, last_n_games=last_n_games)
     # Get team name
-    teams_df = fpl_data.get_teams_df()
-    team_row = teams_df.loc[teams_df["id"] == team_id]
-    if not team_row.empty:
-        team_name = team_row.iloc[0]["name"]
-    else:
-        team_name = str(team_id)
+    team_names = _teams_indexed(bucket)["name"]
+    team_name = team_names.get(team_id, str(team_id))
     return (
         f"Summary for {team_name} (last {summary['games']} completed games):\n"
         f"Wins: {summary['wins']}, Draws: {summary['draws']}, Losses: {summary['losses']}\n"
@@ -286,10 +542,17 @@ def get_player_history(player: str, last_n_games: Optional[int] = None) -> str:
         minutes, goals_scored, assists, total_points, goals_conceded,
         yellow_cards and red_cards.
     """
+    return _player_history(player, last_n_games, _hour_bucket())
+
+
+# Player histories come from the live element-summary endpoint rather than
+# the bootstrap tables, so besides expiring with the hour bucket they are
+# dropped whenever fresh data is downloaded.
+@functools.lru_cache(maxsize=256)
+def _player_history(player: str, last_n_games: Optional[int], bucket: int) -> str:
     # Resolve player ID
-    try:
-        player_id = int(player)
-    except Exception:
+    player_id = _parse_id(player)
+    if player_id is None:
         player_id = fpl_data.get_player_id_by_name(str(player))
     if player_id is None:
         return f"Player '{player}' not found."
@@ -300,10 +563,8 @@ def get_player_history(player: str, last_n_games: Optional[int] = None) -> str:
     if last_n_games is not None and last_n_games > 0:
         history_df = history_df.tail(last_n_games)
     # Map opponent team ID to name
-    teams_df = fpl_data.get_teams_df()[["id", "name"]]
-    history_df = history_df.merge(teams_df, left_on="opponent_team", right_on="id", how="left").rename(
-        columns={"name": "opponent_team_name"}
-    ).drop(columns=["id"])
+    team_names = _teams_indexed(bucket)["name"]
+    history_df = history_df.assign(opponent_team_name=history_df["opponent_team"].map(team_names))
     # Some columns might not exist if season hasn't started; use what is available
     cols = []
     for col in [
@@ -321,8 +582,10 @@ def get_player_history(player: str, last_n_games: Optional[int] = None) -> str:
             cols.append(col)
     if not cols:
         return f"No relevant statistics available for player '{player}'."
-    display_df = history_df[cols]
     # Sort by round ascending if present
-    if "round" in display_df.columns:
-        display_df = display_df.sort_values(by="round")
-    return display_df.to_string(index=False)
\ No newline at end of file
+    if "round" in cols:
+        history_df = history_df.sort_values(by="round")
+    return history_df.to_string(index=False, columns=cols)
+
+
+fpl_data.register_refresh_hook(_player_history.cache_clear)
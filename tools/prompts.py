@@ -15,6 +15,37 @@ from __future__ import annotations
 # as a script (python tools/prompts.py) from the fpl_server directory.
 from server import mcp  # type: ignore
 
+# Prompt bodies are static, so build each string once at import time and
+# hand back the same object on every call.
+_FPL_QUERY_GUIDANCE: str = (
+    "Use `query_fpl_data` with the appropriate `entity` ('players', 'fixtures' or 'teams') and "
+    "supply a `filters` dictionary mapping field names to conditions. Valid operators are eq, lt, "
+    "lte, gt, gte and contains. Fields for players include id, first_name, second_name, "
+    "element_type (1=GKP, 2=DEF, 3=MID, 4=FWD), position (GKP, DEF, MID, FWD), team_name, price_m, "
+    "total_points, minutes, goals_scored, assists, yellow_cards, red_cards and selected_by_percent. "
+    "Fields for fixtures include id, event, kickoff_time, team_h_name, team_a_name, team_h_score, "
+    "team_a_score and finished. Fields for teams include id, name, short_name and strength_* fields. "
+    "Ensure numeric comparisons use numbers (e.g. 25.0 for selected_by_percent)."
+)
+
+_VIDEO_SUMMARY_GUIDANCE: str = (
+    "When given a YouTube link to an FPL-related podcast or video and asked to summarise or "
+    "extract recommendations, use the `summarise_fpl_youtube` tool. Pass the full URL in the "
+    "`url` parameter. The tool returns a concise overall 'summary' of the video, a list of up "
+    "to ten recommended players with reasoning (including their price and position), and a list "
+    "of broader 'main_points' topics with brief summaries. It also returns the video ID for reference."
+)
+
+_TRANSCRIPT_SUMMARY_GUIDANCE: str = (
+    "To summarise a raw YouTube transcript for FPL, ignore filler and focus on lines that "
+    "mention players, prices, minutes, rotation, fixtures, captaincy, differentials or chip "
+    "strategies.  Extract the players mentioned and note why they were discussed.  Group the "
+    "discussion into themes such as Captaincy, Fixtures Analysis, Differentials, Rotation and "
+    "Chip Strategy, and summarise each in one or two sentences.  Finally write a concise "
+    "paragraph capturing the overall narrative of the video.  Use the transcript context to "
+    "answer follow‑up questions about recommendations or strategies."
+)
+
 
 @mcp.prompt()
 def fpl_query_guidance() -> str:
@@ -98,16 +129,7 @@ def fpl_query_guidance() -> str:
         }
 
     """
-    return (
-        "Use `query_fpl_data` with the appropriate `entity` ('players', 'fixtures' or 'teams') and "
-        "supply a `filters` dictionary mapping field names to conditions. Valid operators are eq, lt, "
-        "lte, gt, gte and contains. Fields for players include id, first_name, second_name, "
-        "element_type (1=GKP, 2=DEF, 3=MID, 4=FWD), position (GKP, DEF, MID, FWD), team_name, price_m, "
-        "total_points, minutes, goals_scored, assists, yellow_cards, red_cards and selected_by_percent. "
-        "Fields for fixtures include id, event, kickoff_time, team_h_name, team_a_name, team_h_score, "
-        "team_a_score and finished. Fields for teams include id, name, short_name and strength_* fields. "
-        "Ensure numeric comparisons use numbers (e.g. 25.0 for selected_by_percent)."
-    )
+    return _FPL_QUERY_GUIDANCE
 
 
 @mcp.prompt()
@@ -156,13 +178,7 @@ def video_summary_guidance() -> str:
     content, and use ``players`` to provide actionable
     recommendations or insights.
     """
-    return (
-        "When given a YouTube link to an FPL-related podcast or video and asked to summarise or "
-        "extract recommendations, use the `summarise_fpl_youtube` tool. Pass the full URL in the "
-        "`url` parameter. The tool returns a concise overall 'summary' of the video, a list of up "
-        "to ten recommended players with reasoning (including their price and position), and a list "
-        "of broader 'main_points' topics with brief summaries. It also returns the video ID for reference."
-    )
+    return _VIDEO_SUMMARY_GUIDANCE
 
 
 @mcp.prompt()
@@ -207,4 +223,4 @@ def transcript_summary_guidance() -> str:
     rationale (price, minutes, fixtures, etc.), and high‑level
     strategic advice.
     """
-    return "To summarise a raw YouTube transcript for FPL, ignore filler and focus on lines that mention players, prices, minutes, rotation, fixtures, captaincy, differentials or chip strategies.  Extract the players mentioned and note why they were discussed.  Group the discussion into themes such as Captaincy, Fixtures Analysis, Differentials, Rotation and Chip Strategy, and summarise each in one or two sentences.  Finally write a concise paragraph capturing the overall narrative of the video.  Use the transcript context to answer follow‑up questions about recommendations or strategies."
+    return _TRANSCRIPT_SUMMARY_GUIDANCE
@@ -14,9 +14,9 @@ format the results in a human‑readable manner.
 
 from __future__ import annotations
 
-from typing import Dict, Any
-
-import requests
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 # Absolute imports so that this module can be run from the project
 # root using uv or python without a package context.  Avoid leading
@@ -27,25 +27,98 @@ from server import mcp  # type: ignore
 # Team ID to query. Update this value if you wish to inspect a different team.
 TEAM_ID: int = 4118472
 
+# Display order of positions in the picks table
+_POSITION_ORDER: Dict[str, int] = {"GKP": 0, "DEF": 1, "MID": 2, "FWD": 3}
 
-def _fetch_team_event_picks(team_id: int, gw: int) -> Dict[str, Any]:
-    """Fetch the picks for a team in a given gameweek.
+# Row layout for the get_team_picks preview: position, player, team, price, pts, mult, C/V
+_PICKS_ROW_FMT = "%-8s %-28s %-5s %-5.1f %-4s %-4s %s"
 
-    Args:
-        team_id: FPL entry/team identifier.
-        gw: Gameweek number (1–38).
+# Keys of each pick entry returned by get_team_picks, in row order
+_PICK_FIELDS = ("pos", "name", "team", "price", "pts", "mult", "cv")
 
-    Returns:
-        JSON dictionary containing picks and chip usage.
-    """
-    endpoint = f"https://fantasy.premierleague.com/api/entry/{team_id}/event/{gw}/picks/"
-    resp = requests.get(endpoint)
-    resp.raise_for_status()
-    return resp.json()
+# Squad slots 1-11 are the starting XI; 12-15 are the bench
+_STARTING_XI = 11
+
+# Cached element id → (position, full_name, team_short, now_cost, total_points)
+# mapping used to render picks.  Rebuilt after the bootstrap data is refreshed.
+_PLAYERS_BY_ID: Optional[Dict[int, Tuple[str, str, str, int, int]]] = None
+
+
+def _players_by_id() -> Dict[int, Tuple[str, str, str, int, int]]:
+    """Return the cached mapping of element id to the player fields shown in picks."""
+    global _PLAYERS_BY_ID
+    if _PLAYERS_BY_ID is None:
+        df = fpl_data.get_elements_indexed()
+        teams = fpl_data.get_teams_df()
+        team_short = dict(zip(teams["id"], teams["short_name"]))
+        _PLAYERS_BY_ID = {
+            int(r.id): (
+                r.position,
+                f"{r.first_name} {r.second_name}",
+                team_short.get(r.team, r.team_name),
+                r.now_cost,
+                r.total_points,
+            )
+            for r in df.itertuples(index=False)
+        }
+    return _PLAYERS_BY_ID
+
+
+def _invalidate() -> None:
+    """Drop the cached players mapping so it is rebuilt on next use."""
+    global _PLAYERS_BY_ID
+    _PLAYERS_BY_ID = None
+
+
+fpl_data.register_refresh_hook(_invalidate)
+
+
+def _picks_result(
+    gw: int, data: Dict[str, Any], players: Dict[int, Tuple[str, str, str, int, int]]
+) -> Dict[str, Any]:
+    """Join a picks payload against ``players`` and build the tool result."""
+    picks = data.get("picks", [])
+
+    # Join picks against the players mapping in one pass, producing
+    # (position, player, team, price, pts, mult, C/V) rows and noting
+    # which of them are in the starting XI
+    rows = []
+    starters = []
+    for pick in picks:
+        player = players.get(pick.get("element"))
+        if player is None:
+            # Skip unknown IDs
+            continue
+        pos_short, name, team_short, now_cost, points = player
+        is_cap = "C" if pick.get("is_captain", False) else ("V" if pick.get("is_vice_captain", False) else "")
+        row = (pos_short, name, team_short, now_cost / 10.0, points, pick.get("multiplier", 1), is_cap)
+        rows.append(row)
+        if pick.get("position", 0) <= _STARTING_XI:
+            starters.append(row)
+    if not rows:
+        return {
+            "gw": gw,
+            "team_id": TEAM_ID,
+            "picks": [],
+            "preview": f"No picks found for team {TEAM_ID} in gameweek {gw}.",
+        }
+    # Sort by position order: GK, DEF, MID, FWD then by multiplier descending
+    order = lambda r: (_POSITION_ORDER.get(r[0], 99), -r[5])
+    rows.sort(key=order)
+    starters.sort(key=order)
+    header = f"Starting XI for GW{gw} (team {TEAM_ID}):\n"
+    header += "Position  Player                        Team  Price  Pts  Mult  C/V\n"
+    header += "----------------------------------------------------------------\n"
+    return {
+        "gw": gw,
+        "team_id": TEAM_ID,
+        "picks": [dict(zip(_PICK_FIELDS, r)) for r in rows],
+        "preview": header + "\n".join([_PICKS_ROW_FMT % r for r in starters]),
+    }
 
 
 @mcp.tool()
-def get_team_picks(gw: int) -> str:
+def get_team_picks(gw: int) -> Dict[str, Any]:
     """Retrieve the squad picks for the configured team in a specific gameweek.
 
     Args:
@@ -53,68 +126,73 @@ def get_team_picks(gw: int) -> str:
             gameweek to see your latest picks.
 
     Returns:
-        A formatted listing of players selected for that gameweek,
-        including captaincy and multiplier information. The output
-        includes each player's position, team, price and total
-        points to aid in analysis.
+        A dictionary with ``gw``, ``team_id`` and ``picks`` (one entry
+        per squad player with ``pos``, ``name``, ``team`` (short
+        name), ``price``, ``pts``, ``mult`` and ``cv``), plus a
+        ``preview`` string formatting only the starting XI.
 
     Example:
 
         ``get_team_picks(3)``
 
     ````
-    Team picks for GW3:
-    ============================================
-    Position  Player               Team     Price   Pts  Mult  C/V
-    ------------------------------------------------------------
-    GK        Ederson             MCI      5.5    12    1      
-    DEF       Alexander-Arnold    LIV      8.0    15    2      C
-    ...
+    {
+      "gw": 3,
+      "team_id": 4118472,
+      "picks": [
+        {"pos": "GKP", "name": "Ederson Moraes", "team": "MCI", "price": 5.5,
+         "pts": 12, "mult": 1, "cv": ""},
+        ...
+      ],
+      "preview": "Starting XI for GW3 (team 4118472):\nPosition  Player ..."
+    }
     ````
     """
-    data = _fetch_team_event_picks(TEAM_ID, gw)
-    picks = data.get("picks", [])
-    # Load elements DataFrame to map ids to names and positions
-    elements_df = fpl_data.get_elements_df()
-    # Create mapping of element id to row for quick lookup
-    elements_df = elements_df.set_index("id")
+    if _PLAYERS_BY_ID is not None:
+        return _picks_result(gw, fpl_data.get_entry_picks(TEAM_ID, gw), _PLAYERS_BY_ID)
+    # Cold cache: build the id → player details mapping on a worker thread
+    # while the picks request is in flight
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        players = pool.submit(_players_by_id)
+        data = fpl_data.get_entry_picks(TEAM_ID, gw)
+        return _picks_result(gw, data, players.result())
 
-    # Build table rows
-    rows = []
-    for pick in picks:
-        elem_id = pick.get("element")
-        player = elements_df.loc.get(elem_id)
-        if player is None:
-            # Skip unknown IDs
-            continue
-        pos_short = player["position"]
-        name = f"{player['first_name']} {player['second_name']}"
-        team_name = player["team_name"]
-        price_m = player["now_cost"] / 10.0
-        points = player["total_points"]
-        mult = pick.get("multiplier", 1)
-        is_cap = "C" if pick.get("is_captain", False) else ("V" if pick.get("is_vice_captain", False) else "")
-        rows.append({
-            "Position": pos_short,
-            "Player": name,
-            "Team": team_name,
-            "Price": price_m,
-            "Pts": points,
-            "Mult": mult,
-            "C/V": is_cap,
-        })
-    if not rows:
-        return f"No picks found for team {TEAM_ID} in gameweek {gw}."
-    # Sort by position order: GK, DEF, MID, FWD then by multiplier descending
-    order = {"GKP": 0, "DEF": 1, "MID": 2, "FWD": 3}
-    rows.sort(key=lambda r: (order.get(r["Position"], 99), -r["Mult"]))
-    # Build header and table string
-    header = f"Team picks for GW{gw} (team {TEAM_ID}):\n"
-    header += "Position  Player                        Team               Price  Pts  Mult  C/V\n"
-    header += "-----------------------------------------------------------------------------\n"
-    lines = []
-    for r in rows:
-        lines.append(
-            f"{r['Position']:<8} {r['Player']:<28} {r['Team']:<18} {r['Price']:<5.1f} {r['Pts']:<4} {r['Mult']:<4} {r['C/V']}"
+
+@mcp.tool()
+async def get_team_picks_multi(gws: List[int]) -> List[Dict[str, Any]]:
+    """Retrieve the squad picks for the configured team across several gameweeks.
+
+    The gameweeks are fetched concurrently, so this is much faster
+    than calling ``get_team_picks`` once per gameweek.
+
+    Args:
+        gws: Gameweek numbers (1 through 38).
+
+    Returns:
+        A list aligned with ``gws`` holding the same dictionary that
+        ``get_team_picks`` returns for each gameweek.  If a gameweek
+        could not be fetched its entry has ``gw``, ``team_id`` and an
+        ``error`` message instead.
+
+    Example:
+
+        ``get_team_picks_multi([1, 2, 3])``
+    """
+    import httpx
+
+    limits = httpx.Limits(max_connections=8)
+    async with httpx.AsyncClient(
+        headers={"User-Agent": "fpl-mcp/1.0"}, limits=limits, timeout=10
+    ) as client:
+        fetched = await asyncio.gather(
+            *[fpl_data.get_entry_picks_async(client, TEAM_ID, gw) for gw in gws],
+            return_exceptions=True,
         )
-    return header + "\n".join(lines)
\ No newline at end of file
+    players = _players_by_id()
+    results: List[Dict[str, Any]] = []
+    for gw, data in zip(gws, fetched):
+        if isinstance(data, Exception):
+            results.append({"gw": gw, "team_id": TEAM_ID, "error": str(data)})
+        else:
+            results.append(_picks_result(gw, data, players))
+    return results
@@ -33,7 +33,7 @@ from __future__ import annotations
 from typing import Dict
 
 from server import mcp  # Shared FastMCP instance
-from utils.video_transcript import extract_video_id, get_transcript
+from utils.video_transcript import extract_video_id, get_transcript_text
 
 
 @mcp.tool()
@@ -60,7 +60,8 @@ def fetch_youtube_transcript(url: str) -> Dict[str, str]:  # type: ignore[overri
     video_id = extract_video_id(url)
     if not video_id:
         return {"transcript": "", "video_id": None}
-    lines = get_transcript(video_id)
-    # Join lines with newlines to preserve some structure for the LLM
-    transcript_text = "\n".join(lines)
+    # Lines are joined with newlines to preserve some structure for the
+    # LLM.  The transcript is memoised by get_transcript_text, so repeat
+    # calls for a video do not download it again.
+    transcript_text = get_transcript_text(video_id)
     return {"transcript": transcript_text, "video_id": video_id}
\ No newline at end of file
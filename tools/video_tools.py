@@ -32,71 +32,205 @@ without manual listening.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import functools
+import re
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional; names are then shortlisted by prefix instead
+    ahocorasick = None
 
 from server import mcp  # Shared FastMCP instance
 from utils.video_transcript import extract_video_id, get_transcript
-from utils.fpl_data import get_elements_df
+from utils.fpl_data import get_elements_df, register_refresh_hook
 
 
+@functools.lru_cache(maxsize=1)
 def _get_player_lookup() -> Dict[str, Dict[str, object]]:
     """Create a lookup of full player names to their price and position.
 
     Returns a dictionary keyed by lowercase ``"first last"`` strings,
     with values containing ``price`` (float, millions) and
-    ``position`` (GKP/DEF/MID/FWD).
+    ``position`` (GKP/DEF/MID/FWD).  The lookup is built once and
+    shared, so treat it as read-only; it is rebuilt after the bootstrap
+    data is refreshed.
     """
     df = get_elements_df()
-    lookup: Dict[str, Dict[str, object]] = {}
     pos_map = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
-    for _, row in df.iterrows():
-        name = f"{row['first_name']} {row['second_name']}".lower()
-        lookup[name] = {
-            "price": row["now_cost"] / 10,
-            "position": pos_map.get(row["element_type"], "")
-        }
-    return lookup
+    # Work column-wise and zip over the arrays instead of iterrows(),
+    # which builds a Series for every player
+    prices = df["now_cost"].to_numpy() / 10
+    positions = df["element_type"].map(pos_map).fillna("")
+    return {
+        f"{first} {second}".lower(): {"price": price, "position": position}
+        for first, second, price, position in zip(
+            df["first_name"].tolist(), df["second_name"].tolist(),
+            prices.tolist(), positions.tolist(),
+        )
+    }
+
+
+register_refresh_hook(_get_player_lookup.cache_clear)
+
+
+# Keywords marking a transcript line as useful reasoning for a player.
+# These capture price, minutes, rotation, fixtures and other FPL‑relevant
+# topics.
+_REASONING_KEYWORDS = (
+    "price", "cost", "cheap", "value", "rotation", "minutes", "x mins",
+    "fixtures", "fixture", "captain", "captaincy", "talisman", "differential",
+    "differentials", "punt", "safe", "risk", "explosive", "form", "expected",
+    "penalty", "injury", "injuries", "bench", "substitute", "nailed",
+)
+
+# Map keywords to general topic names.  If multiple keywords match, the
+# first one in this list takes precedence.
+_KEYWORDS_TO_TOPIC = (
+    ("captain", "Captaincy"),
+    ("captaincy", "Captaincy"),
+    ("differential", "Differentials"),
+    ("differentials", "Differentials"),
+    ("fixtures", "Fixtures Analysis"),
+    ("fixture", "Fixtures Analysis"),
+    ("rotation", "Rotation"),
+    ("minutes", "Rotation"),
+    ("injury", "Injuries"),
+    ("injuries", "Injuries"),
+    ("goalkeeper", "Goalkeepers"),
+    ("keepers", "Goalkeepers"),
+    ("bench", "Benching"),
+    ("wildcard", "Wildcard"),
+    ("free hit", "Free Hit"),
+    ("chip", "Chips"),
+)
+
+# FPL‑specific keywords prioritised by the overall summary
+_PRIORITY_WORDS = (
+    "player", "players", "captain", "captaincy", "fixtures", "fixture",
+    "differential", "minutes", "rotation", "rank", "team",
+)
+
+
+def _alternation(words: Iterable[str]) -> str:
+    """Return a regex alternation matching any of ``words`` literally."""
+    return "|".join(map(re.escape, words))
+
+
+# Keyword presence checks run on lowercased lines as one regex search
+# each.  Topic assignment keeps a loop over ``_KEYWORDS_TO_TOPIC`` since
+# it must honour keyword precedence rather than position in the line.
+_REASONING_RE = re.compile(_alternation(_REASONING_KEYWORDS))
+_PRIORITY_RE = re.compile(_alternation(_PRIORITY_WORDS))
+# Any keyword at all from the tables above; a transcript without one is
+# not treated as an FPL video
+_RELEVANCE_RE = re.compile(_alternation(sorted(
+    {*_REASONING_KEYWORDS, *(kw for kw, _ in _KEYWORDS_TO_TOPIC), *_PRIORITY_WORDS}
+)))
+
+# Length of the name prefix used to shortlist the players a line may
+# mention when pyahocorasick is not installed
+_PREFIX_LEN = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _player_matcher(names: Tuple[str, ...]) -> Callable[[str], List[int]]:
+    """Build a multi-pattern matcher over lowercase player names.
+
+    Args:
+        names: Lowercase ``"first last"`` player names.
+
+    Returns:
+        A function taking a lowercased line and returning the indexes
+        into ``names`` of every name occurring in it as a substring,
+        in ascending order.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for i, name in enumerate(names):
+            automaton.add_word(name, i)
+        automaton.make_automaton()
+
+        def find(text: str) -> List[int]:
+            return sorted({i for _, i in automaton.iter(text)})
+
+        return find
+
+    # Without an automaton, only check the names whose prefix occurs
+    # somewhere in the line
+    by_prefix: Dict[str, List[int]] = {}
+    short: List[int] = []
+    for i, name in enumerate(names):
+        if len(name) < _PREFIX_LEN:
+            short.append(i)
+        else:
+            by_prefix.setdefault(name[:_PREFIX_LEN], []).append(i)
+
+    def find(text: str) -> List[int]:
+        grams = {text[j:j + _PREFIX_LEN] for j in range(len(text) - _PREFIX_LEN + 1)}
+        candidates = short + [i for g in by_prefix.keys() & grams for i in by_prefix[g]]
+        return sorted(i for i in candidates if names[i] in text)
+
+    return find
+
+
+# A non-blank transcript line as (original, lowercased, stripped)
+_Line = Tuple[str, str, str]
+
 
+def _prepare(transcript: List[str]) -> List[_Line]:
+    """Lowercase and strip each non-blank transcript line once.
 
-def _extract_players_from_transcript(transcript: List[str], top_n: int = 10) -> List[Dict[str, str]]:
+    The analysers below all work on the prepared lines, so that no line
+    is lowercased or stripped more than once per summary.
+    """
+    prepared = []
+    for line in transcript:
+        stripped = line.strip()
+        if stripped:
+            prepared.append((line, line.lower(), stripped))
+    return prepared
+
+
+def _extract_players_from_transcript(transcript: List[_Line], top_n: int = 10) -> List[Dict[str, str]]:
     """Identify and summarise the most mentioned players in a transcript.
 
     Args:
-        transcript: List of transcript lines (strings).
+        transcript: Transcript lines as returned by :func:`_prepare`.
         top_n: Maximum number of players to return.
 
     Returns:
         A list of dictionaries with ``player_name`` and ``reasoning``.
     """
     lookup = _get_player_lookup()
-    mention_counts: Dict[str, int] = {}
-    # Keep track of the transcript lines for each player
-    lines_by_player: Dict[str, List[str]] = {}
-    for line in transcript:
-        lower_line = line.lower()
-        for name in lookup.keys():
-            # Use a simple substring check on the full name.  This
-            # avoids false positives (e.g. "man" matching "manager").
-            if name in lower_line:
-                mention_counts[name] = mention_counts.get(name, 0) + 1
-                lines_by_player.setdefault(name, []).append(line.strip())
-    # Sort by frequency and take the top players
-    sorted_players = sorted(mention_counts.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    mention_counts: Counter[str] = Counter()
+    # Keep track of the transcript lines for each player, as (stripped
+    # line, whether it contains a reasoning keyword)
+    lines_by_player: Dict[str, List[Tuple[str, bool]]] = defaultdict(list)
+    names = tuple(lookup)
+    # Match on the full name as a substring.  This avoids false
+    # positives (e.g. "man" matching "manager").
+    find_names = _player_matcher(names)
+    for _, lower, stripped in transcript:
+        hits = find_names(lower)
+        if not hits:
+            continue
+        # Checked once per line, however many players it mentions
+        entry = (stripped, _REASONING_RE.search(lower) is not None)
+        for i in hits:
+            name = names[i]
+            mention_counts[name] += 1
+            lines_by_player[name].append(entry)
+    # Take the top players by frequency (ties keep first-mention order)
+    sorted_players = mention_counts.most_common(top_n)
     players: List[Dict[str, str]] = []
-    # Keywords to look for when extracting reasoning.  These capture
-    # price, minutes, rotation, fixtures and other FPL‑relevant topics.
-    KEYWORDS = [
-        "price", "cost", "cheap", "value", "rotation", "minutes", "minutes", "x mins",
-        "fixtures", "fixture", "captain", "captaincy", "talisman", "differential",
-        "differentials", "punt", "safe", "risk", "explosive", "form", "expected",
-        "penalty", "minutes", "injury", "injuries", "bench", "substitute", "nailed"
-    ]
     for name, freq in sorted_players:
-        lines = lines_by_player.get(name, [])
+        lines = lines_by_player[name]
         # Collect lines containing keywords for better context
-        keyword_lines = [ln for ln in lines if any(kw in ln.lower() for kw in KEYWORDS)]
+        keyword_lines = [ln for ln, has_keyword in lines if has_keyword]
         # If no keyword lines, fall back to the first three mentions
-        selected_lines = keyword_lines if keyword_lines else lines[:3]
+        selected_lines = keyword_lines if keyword_lines else [ln for ln, _ in lines[:3]]
         reasoning = " ".join(selected_lines).strip()
         # Append price and position where available
         info = lookup.get(name, {})
@@ -111,7 +245,7 @@ def _extract_players_from_transcript(transcript: List[str], top_n: int = 10) ->
     return players
 
 
-def _extract_main_points(transcript: List[str], max_points: int = 5) -> List[Dict[str, str]]:
+def _extract_main_points(transcript: List[_Line], max_points: int = 5) -> List[Dict[str, str]]:
     """Identify major discussion topics in the transcript.
 
     This function scans the transcript for lines containing FPL‑relevant
@@ -120,43 +254,24 @@ def _extract_main_points(transcript: List[str], max_points: int = 5) -> List[Dic
     summary for each.
 
     Args:
-        transcript: List of transcript strings.
+        transcript: Transcript lines as returned by :func:`_prepare`.
         max_points: Maximum number of topics to return.
 
     Returns:
         A list of dictionaries with ``topic`` and ``summary`` keys.
     """
-    # Map keywords to general topic names.  If multiple keywords
-    # match, the first one in this list takes precedence.
-    KEYWORDS_TO_TOPIC = [
-        ("captain", "Captaincy"),
-        ("captaincy", "Captaincy"),
-        ("differential", "Differentials"),
-        ("differentials", "Differentials"),
-        ("fixtures", "Fixtures Analysis"),
-        ("fixture", "Fixtures Analysis"),
-        ("rotation", "Rotation"),
-        ("minutes", "Rotation"),
-        ("injury", "Injuries"),
-        ("injuries", "Injuries"),
-        ("goalkeeper", "Goalkeepers"),
-        ("keepers", "Goalkeepers"),
-        ("bench", "Benching"),
-        ("wildcard", "Wildcard"),
-        ("free hit", "Free Hit"),
-        ("chip", "Chips"),
-    ]
     # Collect lines for each topic
     topic_lines: Dict[str, List[str]] = {}
-    for line in transcript:
-        lower_line = line.lower()
-        for keyword, topic in KEYWORDS_TO_TOPIC:
+    for _, lower_line, stripped in transcript:
+        for keyword, topic in _KEYWORDS_TO_TOPIC:
             if keyword in lower_line:
-                topic_lines.setdefault(topic, []).append(line.strip())
+                topic_lines.setdefault(topic, []).append(stripped)
                 break  # assign to first matching topic
-    # Build topic summaries
+    # Rank topics by number of mentions (desc) up front, so only the
+    # topics that are returned get a summary built
+    ranked = sorted(topic_lines.items(), key=lambda item: len(item[1]), reverse=True)
     points: List[Dict[str, str]] = []
-    for topic, lines in topic_lines.items():
+    for topic, lines in ranked[:max_points]:
         # Summarise by joining the first few lines containing this topic
         selected = lines[:3]
         summary = " ".join(selected)
@@ -164,12 +279,10 @@ def _extract_main_points(transcript: List[str], max_points: int = 5) -> List[Dic
         if len(summary) > 300:
             summary = summary[:297].rsplit(" ", 1)[0] + "…"
         points.append({"topic": topic, "summary": summary})
-    # Return up to max_points topics, sorted by number of mentions (desc)
-    sorted_points = sorted(points, key=lambda x: len(topic_lines[x["topic"]]), reverse=True)
-    return sorted_points[:max_points]
+    return points
 
 
-def _summarise_overall(transcript: List[str], max_chars: int = 600) -> str:
+def _summarise_overall(transcript: List[_Line], max_chars: int = 600) -> str:
     """Generate an overall summary of a transcript.
 
     This function selects lines at roughly regular intervals through
@@ -179,7 +292,7 @@ def _summarise_overall(transcript: List[str], max_chars: int = 600) -> str:
     ``max_chars`` is reached.
 
     Args:
-        transcript: List of transcript strings.
+        transcript: Transcript lines as returned by :func:`_prepare`.
         max_chars: Maximum length of the summary.
 
     Returns:
@@ -187,32 +300,24 @@ def _summarise_overall(transcript: List[str], max_chars: int = 600) -> str:
     """
     if not transcript:
         return ""
-    # FPL‑specific keywords to prioritise
-    PRIORITY_WORDS = [
-        "player", "players", "captain", "captaincy", "fixtures", "fixture",
-        "differential", "minutes", "rotation", "rank", "team",
-    ]
     selected_lines: List[str] = []
     total_chars = 0
     # First pick lines containing priority words
-    for line in transcript:
-        lower = line.lower()
-        if any(w in lower for w in PRIORITY_WORDS):
+    for line, lower, stripped in transcript:
+        if _PRIORITY_RE.search(lower):
             if total_chars + len(line) + 1 > max_chars:
                 break
-            selected_lines.append(line.strip())
+            selected_lines.append(stripped)
             total_chars += len(line) + 1
             # Stop if we already have a few sentences
             if len(selected_lines) >= 5:
                 break
     # If we still have space, append the very first lines of the transcript
     if total_chars < max_chars:
-        for line in transcript:
-            if not line.strip():
-                continue
+        for line, _, stripped in transcript:
             if total_chars + len(line) + 1 > max_chars:
                 break
-            selected_lines.append(line.strip())
+            selected_lines.append(stripped)
             total_chars += len(line) + 1
             if len(selected_lines) >= 7:
                 break
@@ -220,20 +325,18 @@ def _summarise_overall(transcript: List[str], max_chars: int = 600) -> str:
     return summary.strip()
 
 
-def _summarise_general(transcript: List[str], max_chars: int = 800) -> str:
+def _summarise_general(transcript: List[_Line], max_chars: int = 800) -> str:
     """Create a brief summary of the overall video content.
 
-    This function concatenates transcript lines until the character
-    limit is reached.  It skips empty lines and trims whitespace.
+    This function concatenates the prepared (non-blank, trimmed)
+    transcript lines until the character limit is reached.
     """
     summary_lines: List[str] = []
     total_chars = 0
-    for line in transcript:
-        if not line.strip():
-            continue
+    for line, _, stripped in transcript:
         if total_chars + len(line) + 1 > max_chars:
             break
-        summary_lines.append(line.strip())
+        summary_lines.append(stripped)
         total_chars += len(line) + 1
     return " ".join(summary_lines).strip()
 
@@ -268,7 +371,9 @@ def summarise_fpl_youtube(url: str) -> Dict[str, object]:  # type: ignore[overri
         A dictionary with the keys ``summary``, ``players``,
         ``main_points`` and ``video_id``.  If the transcript cannot
         be obtained, ``players`` and ``main_points`` will be empty and
-        ``summary`` will contain an error message.
+        ``summary`` will contain an error message.  The same two lists
+        are empty, with ``summary`` giving a plain overview, when the
+        transcript contains no FPL keywords at all.
     """
     video_id = extract_video_id(url)
     if not video_id:
@@ -285,12 +390,23 @@ def summarise_fpl_youtube(url: str) -> Dict[str, object]:  # type: ignore[overri
             "main_points": [],
             "video_id": video_id,
         }
+    # Lowercase and strip every line once for all the analysers
+    prepared = _prepare(transcript)
+    # One scan over the whole lowercased transcript decides whether the
+    # per-line analysis is worth running at all
+    if not _RELEVANCE_RE.search("\n".join(lower for _, lower, _ in prepared)):
+        return {
+            "summary": _summarise_general(prepared),
+            "players": [],
+            "main_points": [],
+            "video_id": video_id,
+        }
     # Generate the overall summary (approx. 600 characters)
-    overall_summary = _summarise_overall(transcript)
+    overall_summary = _summarise_overall(prepared)
     # Identify the top players and extract reasoning
-    players = _extract_players_from_transcript(transcript)
+    players = _extract_players_from_transcript(prepared)
     # Identify major topics discussed in the video
-    main_points = _extract_main_points(transcript)
+    main_points = _extract_main_points(prepared)
     return {
         "summary": overall_summary,
         "players": players,
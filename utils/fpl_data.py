@@ -13,13 +13,37 @@ SDK is vendored into the repository.  See README.md for details.
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
+import math
 import os
+import threading
+import time
+from email.utils import formatdate
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to the stdlib codec
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional; tables are then built directly by pandas
+    pa = None
+    pq = None
+
+if TYPE_CHECKING:
+    import httpx
 
 
 # Base URL for the Fantasy Premier League API
@@ -29,21 +53,96 @@ FPL_BASE_URL = "https://fantasy.premierleague.com/api"
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# Shared HTTP session so that API calls reuse pooled keep-alive
+# connections; transient failures are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504)),
+    ),
+)
+
+# Set FPL_SPLIT_CACHE=1 to also write each top-level bootstrap key to its
+# own JSON file in DATA_DIR.  Nothing in the server reads those files.
+SPLIT_CACHE = bool(os.environ.get("FPL_SPLIT_CACHE"))
+
+# Callbacks invoked whenever fresh bootstrap data is downloaded.  Modules
+# that memoize values derived from the bootstrap tables register here so
+# their caches are dropped when the underlying data changes.
+_REFRESH_HOOKS: List[Callable[[], None]] = []
+
+
+def register_refresh_hook(hook: Callable[[], None]) -> None:
+    """Register a callback to run after the bootstrap data is refreshed.
+
+    Args:
+        hook: A zero-argument callable, typically one that clears a
+            module-level cache built from :func:`get_elements_df` or
+            similar helpers.
+    """
+    _REFRESH_HOOKS.append(hook)
+
+
+def _read_json(path: Path) -> Any:
+    """Decode a JSON cache file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write ``data`` to a JSON cache file."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def clear_caches() -> None:
+    """Drop every cache derived from the FPL data.
+
+    Runs all registered refresh hooks; :func:`get_bootstrap_data` calls
+    this after downloading fresh data.
+    """
+    for hook in _REFRESH_HOOKS:
+        hook()
 
-def _download_json(endpoint: str) -> Dict[str, Any]:
+
+def _download_json(endpoint: str, cache_path: Optional[Path] = None) -> Any:
     """Download JSON data from the given FPL API endpoint.
 
     Args:
         endpoint: Path relative to the API base, e.g.
             "/bootstrap-static/".
+        cache_path: Optional cache file holding an earlier response.  If
+            it exists the request is made conditional on the data having
+            changed since the file was written.
 
     Returns:
-        The decoded JSON object.
+        The decoded JSON object, or None if the server reports that the
+        data has not been modified since ``cache_path`` was written.
     """
     url = FPL_BASE_URL + endpoint
-    response = requests.get(url)
+    headers = None
+    if cache_path is not None and cache_path.exists():
+        headers = {"If-Modified-Since": formatdate(cache_path.stat().st_mtime, usegmt=True)}
+    response = _SESSION.get(url, headers=headers, timeout=10)
+    if response.status_code == 304:
+        return None
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content) if orjson is not None else response.json()
+
+
+# Decoded bootstrap dataset kept in memory after the first load so that
+# hot paths (current gameweek lookups, table builds) never touch the disk.
+# The lock stops concurrent first calls from loading it twice.
+_BOOTSTRAP_DATA: Optional[Dict[str, Any]] = None
+_BOOTSTRAP_LOCK = threading.Lock()
 
 
 def get_bootstrap_data(force_refresh: bool = False) -> Dict[str, Any]:
@@ -52,41 +151,139 @@ def get_bootstrap_data(force_refresh: bool = False) -> Dict[str, Any]:
     The bootstrap data contains the core tables used by the FPL
     site: players (elements), teams, positions (element_types),
     events, etc. To speed up repeated queries, this function caches
-    the response on disk.
+    the response on disk and keeps the decoded data in memory.
+    The returned dictionary is shared, so treat it as read-only.
 
     Args:
         force_refresh: If True, always download fresh data from
-            the API. Otherwise, use the cached file if present.
+            the API. Otherwise, use the cached copy if present.
 
     Returns:
         A dictionary containing the bootstrap data.
     """
-    cache_path = DATA_DIR / "bootstrap_static.json"
-    if not force_refresh and cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    data = _download_json("/bootstrap-static/")
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(data, f)
-    # Additionally cache individual top-level keys for convenience
-    for key, value in data.items():
-        # Skip simple numeric keys or None
-        filename = f"{key}.json"
-        path = DATA_DIR / filename
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(value, f)
-        except Exception:
-            # Some values may not be serializable (e.g. None) – ignore
-            pass
+    global _BOOTSTRAP_DATA
+    data = _BOOTSTRAP_DATA
+    if not force_refresh and data is not None:
+        return data
+    with _BOOTSTRAP_LOCK:
+        cache_path = DATA_DIR / "bootstrap_static.json"
+        if not force_refresh:
+            if _BOOTSTRAP_DATA is not None:
+                return _BOOTSTRAP_DATA
+            if cache_path.exists():
+                _BOOTSTRAP_DATA = _read_json(cache_path)
+                return _BOOTSTRAP_DATA
+        data = _download_json("/bootstrap-static/", cache_path)
+        if data is None:
+            # Unchanged on the server; keep serving the cached copy
+            if _BOOTSTRAP_DATA is None:
+                _BOOTSTRAP_DATA = _read_json(cache_path)
+            return _BOOTSTRAP_DATA
+        _BOOTSTRAP_DATA = data
+        _write_json(cache_path, data)
+        if SPLIT_CACHE:
+            # Additionally cache individual top-level keys for convenience
+            for key, value in data.items():
+                try:
+                    _write_json(DATA_DIR / f"{key}.json", value)
+                except Exception:
+                    # Some values may not be serializable (e.g. None) – ignore
+                    pass
+    # Let dependent caches know that the bootstrap tables have changed
+    clear_caches()
     return data
 
 
+# Arrow snapshots of the bootstrap tables, keyed by bootstrap key.  Built
+# once per download so that each DataFrame request is a columnar
+# ``to_pandas`` conversion instead of reading and re-parsing the JSON.
+# Each table is also saved as ``DATA_DIR/<key>.parquet`` so that a new
+# process can load it without decoding the bootstrap JSON at all.
+_BOOTSTRAP_TABLES: Dict[str, Any] = {}
+
+
+def _reset_bootstrap_tables() -> None:
+    _BOOTSTRAP_TABLES.clear()
+
+
+register_refresh_hook(_reset_bootstrap_tables)
+
+
+def _read_parquet_table(key: str) -> Any:
+    """Load the parquet snapshot of a bootstrap table if it is current.
+
+    Returns None when the snapshot is missing, unreadable or not newer
+    than the bootstrap JSON cache it was built from.
+    """
+    path = DATA_DIR / f"{key}.parquet"
+    try:
+        if path.stat().st_mtime <= (DATA_DIR / "bootstrap_static.json").stat().st_mtime:
+            return None
+        return pq.read_table(path)
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def _write_parquet_table(key: str, table: Any) -> None:
+    """Save a bootstrap table snapshot; failures only cost a rebuild."""
+    path = DATA_DIR / f"{key}.parquet"
+    tmp_path = path.with_suffix(".parquet.tmp")
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException):
+        pass
+
+
+def _bootstrap_frame(key: str, force_refresh: bool = False) -> pd.DataFrame:
+    """Return a fresh DataFrame for one of the bootstrap tables.
+
+    Args:
+        key: Top-level bootstrap key, e.g. ``"elements"`` or ``"teams"``.
+        force_refresh: If True, download fresh bootstrap data first.
+
+    Returns:
+        A new DataFrame which the caller may modify.
+    """
+    if force_refresh or pa is None:
+        data = get_bootstrap_data(force_refresh=force_refresh)
+        if pa is None:
+            return pd.DataFrame(data[key])
+    table = _BOOTSTRAP_TABLES.get(key)
+    if table is None:
+        table = _read_parquet_table(key)
+        if table is None:
+            records = get_bootstrap_data()[key]
+            try:
+                table = pa.Table.from_struct_array(pa.array(records))
+            except (pa.ArrowException, TypeError):
+                # Records Arrow can't type consistently; let pandas handle them
+                return pd.DataFrame(records)
+            _write_parquet_table(key, table)
+        _BOOTSTRAP_TABLES[key] = table
+    return table.to_pandas()
+
+
+# Players table with team_name and position joined in, built once per
+# bootstrap load.  ``get_elements_df`` hands out copies of it.
+_ELEMENTS_FRAME: Optional[pd.DataFrame] = None
+
+
+def _reset_elements_frame() -> None:
+    global _ELEMENTS_FRAME
+    _ELEMENTS_FRAME = None
+
+
+register_refresh_hook(_reset_elements_frame)
+
+
 def get_elements_df(force_refresh: bool = False) -> pd.DataFrame:
     """Return a DataFrame containing all players (elements).
 
     The resulting DataFrame includes a few extra columns mapping
     numeric IDs to human-friendly names (team_name and position).
+    The joined table is cached, so each call returns a copy which the
+    caller may modify.
 
     Args:
         force_refresh: If True, bypass the cache and fetch fresh
@@ -95,25 +292,59 @@ def get_elements_df(force_refresh: bool = False) -> pd.DataFrame:
     Returns:
         A Pandas DataFrame with player information.
     """
-    data = get_bootstrap_data(force_refresh=force_refresh)
-    elements = pd.DataFrame(data["elements"])
-    teams_df = pd.DataFrame(data["teams"])[["id", "name"]].rename(
-        columns={"id": "team", "name": "team_name"}
-    )
-    positions_df = pd.DataFrame(data["element_types"])[
-        ["id", "singular_name_short"]
-    ].rename(columns={"id": "element_type", "singular_name_short": "position"})
-    # Merge to add team_name and position
-    elements = elements.merge(teams_df, on="team", how="left")
-    elements = elements.merge(positions_df, on="element_type", how="left")
-    # Convert selected_by_percent to float for numeric comparisons.  The API
-    # exposes this as a string (e.g. "25.4") so without conversion
-    # numeric filters and sorts will fail.  Coerce invalid values to NaN.
-    if "selected_by_percent" in elements.columns:
-        elements["selected_by_percent"] = pd.to_numeric(
-            elements["selected_by_percent"], errors="coerce"
-        )
-    return elements
+    global _ELEMENTS_FRAME
+    if force_refresh:
+        get_bootstrap_data(force_refresh=True)
+    if _ELEMENTS_FRAME is None:
+        elements = _bootstrap_frame("elements")
+        teams = _bootstrap_frame("teams")
+        element_types = _bootstrap_frame("element_types")
+        team_names = dict(zip(teams["id"].tolist(), teams["name"].tolist()))
+        positions = dict(zip(
+            element_types["id"].tolist(), element_types["singular_name_short"].tolist()
+        ))
+        # Add team_name and position by mapping the ids through small dicts
+        # rather than merging (and copying) the whole table twice
+        elements["team_name"] = elements["team"].map(team_names)
+        elements["position"] = elements["element_type"].map(positions)
+        # Convert selected_by_percent to float for numeric comparisons.  The API
+        # exposes this as a string (e.g. "25.4") so without conversion
+        # numeric filters and sorts will fail.  Coerce invalid values to NaN.
+        if "selected_by_percent" in elements.columns:
+            elements["selected_by_percent"] = pd.to_numeric(
+                elements["selected_by_percent"], errors="coerce"
+            )
+        _ELEMENTS_FRAME = elements
+    return _ELEMENTS_FRAME.copy()
+
+
+# Players table indexed by element id, shared by every caller of
+# ``get_elements_indexed``.  Reset when the bootstrap data is refreshed.
+_ELEMENTS_INDEXED: Optional[pd.DataFrame] = None
+
+
+def _reset_elements_indexed() -> None:
+    global _ELEMENTS_INDEXED
+    _ELEMENTS_INDEXED = None
+
+
+register_refresh_hook(_reset_elements_indexed)
+
+
+def get_elements_indexed() -> pd.DataFrame:
+    """Return the players DataFrame indexed by element id.
+
+    The frame is built once from :func:`get_elements_df` (keeping ``id``
+    as a column as well) and shared between callers, so treat it as
+    read-only.  It is rebuilt after the bootstrap data is refreshed.
+
+    Returns:
+        A Pandas DataFrame of players with ``id`` as its index.
+    """
+    global _ELEMENTS_INDEXED
+    if _ELEMENTS_INDEXED is None:
+        _ELEMENTS_INDEXED = get_elements_df().set_index("id", drop=False)
+    return _ELEMENTS_INDEXED
 
 
 def get_teams_df(force_refresh: bool = False) -> pd.DataFrame:
@@ -125,8 +356,7 @@ def get_teams_df(force_refresh: bool = False) -> pd.DataFrame:
     Returns:
         DataFrame with id, name, short_name and other team info.
     """
-    data = get_bootstrap_data(force_refresh=force_refresh)
-    return pd.DataFrame(data["teams"])
+    return _bootstrap_frame("teams", force_refresh=force_refresh)
 
 
 def get_element_types_df(force_refresh: bool = False) -> pd.DataFrame:
@@ -138,8 +368,26 @@ def get_element_types_df(force_refresh: bool = False) -> pd.DataFrame:
     Returns:
         DataFrame with id, singular_name_short and other fields.
     """
-    data = get_bootstrap_data(force_refresh=force_refresh)
-    return pd.DataFrame(data["element_types"])
+    return _bootstrap_frame("element_types", force_refresh=force_refresh)
+
+
+def get_current_gameweek() -> int:
+    """Return the current gameweek number according to the bootstrap data.
+
+    If the current gameweek cannot be determined (e.g. off‑season), returns 1.
+    """
+    data = get_bootstrap_data(force_refresh=False)
+    events = data.get("events", [])
+    # Look for the current event
+    for event in events:
+        if event.get("is_current"):
+            return int(event.get("id"))
+    # If no current event, use the next event
+    for event in events:
+        if event.get("is_next"):
+            return int(event.get("id"))
+    # Fall back to the first event
+    return 1
 
 
 def get_player_detail(player_id: int) -> Dict[str, Any]:
@@ -155,12 +403,25 @@ def get_player_detail(player_id: int) -> Dict[str, Any]:
     endpoint = f"/element-summary/{player_id}/"
     return _download_json(endpoint)
 
+# Parsed fixtures table, loaded once; ``get_fixtures_df`` hands out copies
+_FIXTURES_FRAME: Optional[pd.DataFrame] = None
+
+
+def _reset_fixtures_frame() -> None:
+    global _FIXTURES_FRAME
+    _FIXTURES_FRAME = None
+
+
+register_refresh_hook(_reset_fixtures_frame)
+
+
 def get_fixtures_df(force_refresh: bool = False) -> pd.DataFrame:
     """Return a DataFrame containing all fixtures for the season.
 
     The returned DataFrame includes the home and away team IDs, the
     final scores (if finished), and the kickoff time.  To speed up
-    repeated queries the raw JSON is cached in the ``data`` folder.
+    repeated queries the raw JSON is cached in the ``data`` folder and
+    the parsed table is kept in memory; each call returns a copy.
 
     Args:
         force_refresh: If True, download fresh fixtures data even if
@@ -171,20 +432,25 @@ def get_fixtures_df(force_refresh: bool = False) -> pd.DataFrame:
         ``kickoff_time``, ``team_h``, ``team_h_score``, ``team_a``,
         ``team_a_score``, and ``finished``.
     """
-    cache_path = DATA_DIR / "fixtures.json"
-    if not force_refresh and cache_path.exists():
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = _download_json("/fixtures/")
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f)
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    # Ensure kickoff_time is datetime for sorting; errors='coerce' handles None
-    if "kickoff_time" in df.columns:
-        df["kickoff_time"] = pd.to_datetime(df["kickoff_time"], errors="coerce")
-    return df
+    global _FIXTURES_FRAME
+    if force_refresh or _FIXTURES_FRAME is None:
+        cache_path = DATA_DIR / "fixtures.json"
+        if not force_refresh and cache_path.exists():
+            data = _read_json(cache_path)
+        else:
+            data = _download_json("/fixtures/", cache_path)
+            if data is None:
+                # Unchanged on the server since the cache file was written
+                data = _read_json(cache_path)
+            else:
+                _write_json(cache_path, data)
+        # Convert to DataFrame
+        df = pd.DataFrame(data)
+        # Ensure kickoff_time is datetime for sorting; errors='coerce' handles None
+        if "kickoff_time" in df.columns:
+            df["kickoff_time"] = pd.to_datetime(df["kickoff_time"], errors="coerce")
+        _FIXTURES_FRAME = df
+    return _FIXTURES_FRAME.copy()
 
 
 def get_player_history_df(player_id: int) -> pd.DataFrame:
@@ -209,6 +475,209 @@ def get_player_history_df(player_id: int) -> pd.DataFrame:
     return df
 
 
+# Picks responses keyed by (entry_id, gw), holding (expires_at, etag,
+# payload) where ``expires_at`` is on the ``time.monotonic`` clock.  Picks
+# for a finished gameweek never change, so they never expire and are also
+# saved under ``DATA_DIR/picks``; the current gameweek's entry is
+# revalidated with its ETag once ``_PICKS_TTL`` has passed.  The memory
+# cache is dropped on refresh, when the current gameweek may move on.
+_PICKS_TTL = 300.0
+_PICKS_DIR = DATA_DIR / "picks"
+_PICKS_CACHE: Dict[Tuple[int, int], Tuple[float, Optional[str], Dict[str, Any]]] = {}
+
+
+def _reset_picks_cache() -> None:
+    _PICKS_CACHE.clear()
+
+
+register_refresh_hook(_reset_picks_cache)
+
+
+def _picks_path(entry_id: int, gw: int) -> Path:
+    return _PICKS_DIR / f"{entry_id}_{gw}.json"
+
+
+def cached_entry_picks(entry_id: int, gw: int) -> Optional[Dict[str, Any]]:
+    """Return an entry's picks for a gameweek if a fresh copy is cached.
+
+    The memory cache is consulted first, followed by the files of
+    finished gameweeks under ``DATA_DIR/picks``.
+    """
+    entry = _PICKS_CACHE.get((entry_id, gw))
+    if entry is not None:
+        return entry[2] if entry[0] > time.monotonic() else None
+    path = _picks_path(entry_id, gw)
+    if not path.exists():
+        return None
+    try:
+        data = _read_json(path)
+    except (OSError, ValueError):
+        return None
+    _PICKS_CACHE[(entry_id, gw)] = (math.inf, None, data)
+    return data
+
+
+def _picks_request(entry_id: int, gw: int) -> Tuple[str, Optional[Dict[str, str]]]:
+    """Return the picks URL and, if a stale copy is cached, its ETag headers."""
+    url = f"{FPL_BASE_URL}/entry/{entry_id}/event/{gw}/picks/"
+    entry = _PICKS_CACHE.get((entry_id, gw))
+    headers = {"If-None-Match": entry[1]} if entry is not None and entry[1] else None
+    return url, headers
+
+
+def _store_entry_picks(
+    entry_id: int, gw: int, status: int, etag: Optional[str], content: bytes
+) -> Dict[str, Any]:
+    """Cache a picks response and return its payload.
+
+    A ``304`` response re-arms the existing entry instead of decoding a
+    new body.
+    """
+    finished = gw < get_current_gameweek()
+    expires_at = math.inf if finished else time.monotonic() + _PICKS_TTL
+    entry = _PICKS_CACHE.get((entry_id, gw))
+    if status == 304 and entry is not None:
+        # Unchanged since the last fetch; keep the cached payload
+        _PICKS_CACHE[(entry_id, gw)] = (expires_at, entry[1], entry[2])
+        return entry[2]
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
+    _PICKS_CACHE[(entry_id, gw)] = (expires_at, etag, data)
+    if finished:
+        try:
+            _PICKS_DIR.mkdir(parents=True, exist_ok=True)
+            _picks_path(entry_id, gw).write_bytes(content)
+        except OSError:
+            # The disk cache is an optimisation only
+            pass
+    return data
+
+
+def get_entry_picks(entry_id: int, gw: int) -> Dict[str, Any]:
+    """Fetch the picks of an FPL entry (team) for a gameweek.
+
+    Responses are cached per entry and gameweek (see ``_PICKS_CACHE``).
+
+    Args:
+        entry_id: FPL entry/team identifier.
+        gw: Gameweek number (1–38).
+
+    Returns:
+        The decoded ``entry/{id}/event/{gw}/picks/`` payload, holding the
+        picks and chip usage.
+    """
+    data = cached_entry_picks(entry_id, gw)
+    if data is not None:
+        return data
+    url, headers = _picks_request(entry_id, gw)
+    response = _SESSION.get(url, headers=headers, timeout=10)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return _store_entry_picks(
+        entry_id, gw, response.status_code, response.headers.get("ETag"), response.content
+    )
+
+
+async def get_entry_picks_async(
+    client: httpx.AsyncClient, entry_id: int, gw: int
+) -> Dict[str, Any]:
+    """Asynchronous counterpart of :func:`get_entry_picks`.
+
+    Shares its cache but issues the request on ``client``, so that the
+    picks of several entries or gameweeks can be fetched concurrently.
+    """
+    data = cached_entry_picks(entry_id, gw)
+    if data is not None:
+        return data
+    url, headers = _picks_request(entry_id, gw)
+    response = await client.get(url, headers=headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return _store_entry_picks(
+        entry_id, gw, response.status_code, response.headers.get("ETag"), response.content
+    )
+
+
+# Name lookup tables used by ``get_team_id_by_name`` and
+# ``get_player_id_by_name``.  Each holds a dict of exact (casefolded) names
+# to ids plus, for the partial match fallback, the ids in table order and
+# the casefolded names joined into one corpus with the offset at which
+# each row starts.  Reset when the bootstrap data is refreshed.
+_TEAM_NAME_INDEX: Optional[tuple] = None
+_PLAYER_NAME_INDEX: Optional[tuple] = None
+
+# Separators used in the name corpora: between the names of one row, and
+# between rows.  Queries containing either are matched row by row.
+_NAME_SEP = "\x00"
+_ROW_SEP = "\n"
+
+
+def _reset_name_indexes() -> None:
+    global _TEAM_NAME_INDEX, _PLAYER_NAME_INDEX
+    _TEAM_NAME_INDEX = None
+    _PLAYER_NAME_INDEX = None
+
+
+register_refresh_hook(_reset_name_indexes)
+
+
+def _name_corpus(rows: List[Tuple[str, ...]]) -> Tuple[str, List[int]]:
+    """Join name rows into a single searchable string plus row start offsets."""
+    parts = [_NAME_SEP.join(names) for names in rows]
+    starts = []
+    offset = 0
+    for part in parts:
+        starts.append(offset)
+        offset += len(part) + 1
+    return _ROW_SEP.join(parts), starts
+
+
+def _first_partial_match(index: tuple, query: str) -> Optional[int]:
+    """Return the id of the first row with a name containing ``query``."""
+    _, ids, corpus, starts, rows = index
+    if _NAME_SEP in query or _ROW_SEP in query:
+        for row_id, names in zip(ids, rows):
+            if any(query in name for name in names):
+                return row_id
+        return None
+    pos = corpus.find(query)
+    if pos < 0:
+        return None
+    return ids[bisect.bisect_right(starts, pos) - 1]
+
+
+def _team_name_index() -> tuple:
+    global _TEAM_NAME_INDEX
+    if _TEAM_NAME_INDEX is None:
+        teams = get_teams_df()
+        names = teams["name"].str.casefold()
+        if "short_name" in teams.columns:
+            short_names = teams["short_name"].str.casefold()
+        else:
+            short_names = [""] * len(teams)
+        ids = teams["id"].astype(int).tolist()
+        rows = list(zip(names, short_names))
+        exact: Dict[str, int] = {}
+        for team_id, (name, short_name) in zip(ids, rows):
+            # The first team with a matching name or short name wins
+            exact.setdefault(name, team_id)
+            exact.setdefault(short_name, team_id)
+        _TEAM_NAME_INDEX = (exact, ids, *_name_corpus(rows), rows)
+    return _TEAM_NAME_INDEX
+
+
+def _player_name_index() -> tuple:
+    global _PLAYER_NAME_INDEX
+    if _PLAYER_NAME_INDEX is None:
+        df = get_elements_df()
+        ids = df["id"].astype(int).tolist()
+        rows = list(zip(df["first_name"].str.casefold(), df["second_name"].str.casefold()))
+        exact: Dict[str, int] = {}
+        for player_id, (first, second) in zip(ids, rows):
+            exact.setdefault(f"{first} {second}", player_id)
+        _PLAYER_NAME_INDEX = (exact, ids, *_name_corpus(rows), rows)
+    return _PLAYER_NAME_INDEX
+
+
 def get_team_id_by_name(team_name: str) -> Optional[int]:
     """Return the team ID corresponding to a case-insensitive team name.
 
@@ -218,18 +687,15 @@ def get_team_id_by_name(team_name: str) -> Optional[int]:
     Returns:
         The team ID if found, otherwise None.
     """
-    teams = get_teams_df()
+    index = _team_name_index()
     # Normalize names: remove punctuation and casefold
     normalized = team_name.strip().casefold()
     # Attempt exact match on full name or short name
-    for _, row in teams.iterrows():
-        if row["name"].casefold() == normalized or row.get("short_name", "").casefold() == normalized:
-            return int(row["id"])
+    team_id = index[0].get(normalized)
+    if team_id is not None:
+        return team_id
     # Fallback to partial match: return the first team whose name contains the query
-    for _, row in teams.iterrows():
-        if normalized in row["name"].casefold() or normalized in row.get("short_name", "").casefold():
-            return int(row["id"])
-    return None
+    return _first_partial_match(index, normalized)
 
 
 def get_player_id_by_name(name: str) -> Optional[int]:
@@ -244,18 +710,14 @@ def get_player_id_by_name(name: str) -> Optional[int]:
     Returns:
         The player ID if found, otherwise None.
     """
-    df = get_elements_df()
+    index = _player_name_index()
     name = name.strip().casefold()
     # Try exact match on full name
-    for _, row in df.iterrows():
-        full = f"{row['first_name']} {row['second_name']}".casefold()
-        if full == name:
-            return int(row["id"])
+    player_id = index[0].get(name)
+    if player_id is not None:
+        return player_id
     # Try partial match on any name component
-    for _, row in df.iterrows():
-        if name in row["first_name"].casefold() or name in row["second_name"].casefold():
-            return int(row["id"])
-    return None
+    return _first_partial_match(index, name)
 
 
 def compute_team_summary(team: int, last_n_games: int = 5) -> Dict[str, Any]:
@@ -289,33 +751,324 @@ def compute_team_summary(team: int, last_n_games: int = 5) -> Dict[str, Any]:
         team_fixtures.sort_values(by="event", ascending=False, inplace=True)
     # Take last N games
     team_fixtures = team_fixtures.head(last_n_games)
+    # Goals for and against from the team's point of view, one entry per game
+    no_goals = pd.Series(0, index=team_fixtures.index)
+    home_goals = team_fixtures.get("team_h_score", no_goals).fillna(0).to_numpy()
+    away_goals = team_fixtures.get("team_a_score", no_goals).fillna(0).to_numpy()
+    is_home = team_fixtures["team_h"].to_numpy() == team
+    goals_for = np.where(is_home, home_goals, away_goals)
+    goals_against = np.where(is_home, away_goals, home_goals)
+    wins = int(np.count_nonzero(goals_for > goals_against))
+    draws = int(np.count_nonzero(goals_for == goals_against))
     summary = {
-        "games": 0,
-        "wins": 0,
-        "draws": 0,
-        "losses": 0,
-        "goals_scored": 0,
-        "goals_conceded": 0,
-        "points": 0,
+        "games": len(goals_for),
+        "wins": wins,
+        "draws": draws,
+        "losses": len(goals_for) - wins - draws,
+        "goals_scored": int(goals_for.sum()),
+        "goals_conceded": int(goals_against.sum()),
+        "points": 3 * wins + draws,
     }
-    for _, row in team_fixtures.iterrows():
-        summary["games"] += 1
-        if row["team_h"] == team:
-            goals_for, goals_against = row.get("team_h_score", 0), row.get("team_a_score", 0)
+    return summary
+
+
+# Struct-of-arrays view of the players table used by ``query_players``: the
+# table pre-sorted into output order plus NumPy arrays for the columns that
+# have been filtered on, built lazily.  Reset when the bootstrap data is
+# refreshed.
+_PLAYERS_SORTED: Optional[pd.DataFrame] = None
+# The sorted table already projected to the display columns of
+# ``query_players`` (with price_m), so results are a row gather
+_PLAYERS_DISPLAY: Optional[pd.DataFrame] = None
+_PLAYER_COLUMNS: Dict[str, np.ndarray] = {}
+_PLAYER_COLUMNS_LOWER: Dict[str, np.ndarray] = {}
+# Lowercased columns joined into one newline-separated string, with the
+# offset at which each row starts, for substring searches
+_PLAYER_CORPORA: Dict[str, Tuple[str, List[int]]] = {}
+# Inverted indexes (value → sorted row ids) for low-cardinality columns
+# commonly used in equality filters
+_PLAYER_INDEXES: Dict[str, Dict[Any, np.ndarray]] = {}
+_INDEXED_COLUMNS = frozenset({"element_type", "team", "position", "team_name"})
+# Name columns lowercased as soon as the table is loaded, since nearly
+# every ``contains`` filter targets one of them
+_LOWERED_COLUMNS = ("first_name", "second_name", "team_name")
+
+# Comparison operators accepted by ``query_players`` filters
+_QUERY_OPS: Dict[str, np.ufunc] = {
+    "eq": np.equal,
+    "lt": np.less,
+    "lte": np.less_equal,
+    "gt": np.greater,
+    "gte": np.greater_equal,
+}
+
+
+# Rough (cost, selectivity) of each operator, used to evaluate the cheap
+# and selective conditions first so that later ones scan fewer rows
+_OP_COST: Dict[str, Tuple[int, float]] = {
+    "eq": (1, 0.25),
+    "lt": (1, 0.5),
+    "lte": (1, 0.5),
+    "gt": (1, 0.5),
+    "gte": (1, 0.5),
+    "contains": (10, 0.33),
+}
+
+
+def _condition_cost(op: str) -> float:
+    cost, selectivity = _OP_COST.get(op, (1, 1.0))
+    return cost * selectivity
+
+
+def _reset_player_store() -> None:
+    global _PLAYERS_SORTED, _PLAYERS_DISPLAY
+    _PLAYERS_SORTED = None
+    _PLAYERS_DISPLAY = None
+    _PLAYER_COLUMNS.clear()
+    _PLAYER_COLUMNS_LOWER.clear()
+    _PLAYER_INDEXES.clear()
+    _PLAYER_CORPORA.clear()
+    _contains_mask.cache_clear()
+
+
+register_refresh_hook(_reset_player_store)
+
+
+def _players_sorted() -> pd.DataFrame:
+    """Return the players table sorted by total_points desc, now_cost asc.
+
+    Filtering keeps this order, so matching rows come out already ranked.
+    """
+    global _PLAYERS_SORTED
+    if _PLAYERS_SORTED is None:
+        df = get_elements_df()
+        if "total_points" in df.columns:
+            df = df.sort_values(by=["total_points", "now_cost"], ascending=[False, True])
+        _PLAYERS_SORTED = df.reset_index(drop=True)
+        for col in _LOWERED_COLUMNS:
+            if col in df.columns:
+                _PLAYER_COLUMNS_LOWER[col] = _lowered(_PLAYERS_SORTED[col])
+    return _PLAYERS_SORTED
+
+
+def _lowered(series: pd.Series) -> np.ndarray:
+    """Return ``series`` as lowercased fixed-width strings."""
+    return series.astype(str).fillna("").str.lower().to_numpy(dtype=str)
+
+
+def _players_display() -> pd.DataFrame:
+    """Return the sorted players table projected to the display columns."""
+    global _PLAYERS_DISPLAY
+    if _PLAYERS_DISPLAY is None:
+        df = _players_sorted()
+        # Select and rename columns for display
+        display_columns = [
+            "id",
+            "first_name",
+            "second_name",
+            "position",
+            "team_name",
+            "now_cost",
+            "total_points",
+            "minutes",
+            "selected_by_percent",
+        ]
+        # Some older seasons may not have selected_by_percent; guard
+        cols_available = [c for c in display_columns if c in df.columns]
+        if "now_cost" in cols_available:
+            # Convert cost to £m for readability, placed after team_name.
+            # The columns are selected once, with no intermediate copy.
+            lead = ["id", "first_name", "second_name", "position", "team_name"]
+            cols = lead + ["price_m"] + [
+                c for c in cols_available if c not in {*lead, "now_cost"}
+            ]
+            display_df = df.assign(price_m=df["now_cost"].to_numpy() / 10.0)[cols]
+        else:
+            display_df = df[cols_available]
+        _PLAYERS_DISPLAY = display_df
+    return _PLAYERS_DISPLAY
+
+
+def _format_players(df: pd.DataFrame) -> str:
+    """Format player rows exactly as ``df.to_string(index=False)`` would.
+
+    The players table only holds ints, strings and prices/percentages
+    with one decimal place, which can be laid out with plain string
+    operations far faster than pandas' general formatter.  Anything
+    else (no rows, missing values, other floats) goes through
+    ``to_string``.
+    """
+    if df.empty:
+        return df.to_string(index=False)
+    columns: List[List[str]] = []
+    for name in df.columns:
+        series = df[name]
+        kind = series.dtype.kind
+        if kind == "f":
+            values = series.to_numpy()
+            if not (np.isfinite(values).all() and (np.round(values, 1) == values).all()):
+                return df.to_string(index=False)
+            cells = ["%.1f" % v for v in values.tolist()]
+        elif kind in "iu":
+            cells = [str(v) for v in series.tolist()]
+        elif series.hasnans:
+            return df.to_string(index=False)
         else:
-            goals_for, goals_against = row.get("team_a_score", 0), row.get("team_h_score", 0)
-        summary["goals_scored"] += int(goals_for or 0)
-        summary["goals_conceded"] += int(goals_against or 0)
-        # Determine result
-        if goals_for > goals_against:
-            summary["wins"] += 1
-            summary["points"] += 3
-        elif goals_for == goals_against:
-            summary["draws"] += 1
-            summary["points"] += 1
+            cells = [str(v) for v in series.tolist()]
+        width = max(len(name), max(map(len, cells)))
+        if kind in "iuf":
+            # Numbers keep a leading space in the header for the sign
+            width = max(len(name) + 1, width)
+        columns.append([name.rjust(width)] + [cell.rjust(width) for cell in cells])
+    return "\n".join(" ".join(row) for row in zip(*columns))
+
+
+def _player_column(col: str) -> np.ndarray:
+    """Return a column of the sorted players table as a NumPy array."""
+    arr = _PLAYER_COLUMNS.get(col)
+    if arr is None:
+        arr = _PLAYER_COLUMNS[col] = _players_sorted()[col].to_numpy()
+    return arr
+
+
+def _player_column_lower(col: str) -> np.ndarray:
+    """Return a column as lowercased fixed-width strings for ``contains``."""
+    df = _players_sorted()
+    arr = _PLAYER_COLUMNS_LOWER.get(col)
+    if arr is None:
+        arr = _PLAYER_COLUMNS_LOWER[col] = _lowered(df[col])
+    return arr
+
+
+def _player_corpus(col: str) -> Tuple[str, List[int]]:
+    """Return ``col`` as a joined lowercase corpus plus per-row start offsets."""
+    corpus = _PLAYER_CORPORA.get(col)
+    if corpus is None:
+        values = _player_column_lower(col).tolist()
+        starts = []
+        offset = 0
+        for value in values:
+            starts.append(offset)
+            offset += len(value) + 1
+        corpus = _PLAYER_CORPORA[col] = ("\n".join(values), starts)
+    return corpus
+
+
+@functools.lru_cache(maxsize=256)
+def _contains_mask(col: str, needle: str) -> np.ndarray:
+    """Return a read-only mask of the rows of ``col`` containing ``needle``.
+
+    The needle is located with ``str.find`` over the joined corpus, so the
+    whole column is scanned in one C-level search, and each hit is mapped
+    back to its row by bisecting the row offsets.  Results are memoised per
+    (column, needle).
+    """
+    text, starts = _player_corpus(col)
+    mask = np.zeros(len(starts), dtype=bool)
+    pos = text.find(needle)
+    while pos != -1:
+        row = bisect.bisect_right(starts, pos) - 1
+        mask[row] = True
+        # A row only needs to match once; resume at the next row
+        if row + 1 == len(starts):
+            break
+        pos = text.find(needle, starts[row + 1])
+    mask.flags.writeable = False
+    return mask
+
+
+def _indexed_rows(col: str, value: Any) -> Optional[np.ndarray]:
+    """Return the row ids where ``col == value`` from an inverted index.
+
+    Returns None when ``col`` has no index (or ``value`` can't be looked
+    up), in which case the condition is evaluated as a normal filter.
+    """
+    if col not in _INDEXED_COLUMNS:
+        return None
+    index = _PLAYER_INDEXES.get(col)
+    if index is None:
+        index = _PLAYER_INDEXES[col] = _players_sorted().groupby(col, sort=False).indices
+    try:
+        return index.get(value, np.empty(0, dtype=np.intp))
+    except TypeError:
+        return None
+
+
+def _player_mask(col: str, op: str, value: Any, idx: np.ndarray) -> np.ndarray:
+    """Evaluate one filter condition over the rows ``idx`` of the sorted table."""
+    if op == "contains":
+        needle = str(value).lower()
+        if needle and "\n" not in needle:
+            return _contains_mask(col, needle)[idx]
+        return np.char.find(_player_column_lower(col)[idx], needle) >= 0
+    ufunc = _QUERY_OPS.get(op)
+    if ufunc is None:
+        raise ValueError(f"Unsupported operator: {op}")
+    arr = _player_column(col)
+    # Numeric columns compared with numbers run on the raw array; other
+    # comparisons go through pandas for its missing-value handling.
+    if arr.dtype.kind in "biuf" and isinstance(value, (int, float)):
+        return ufunc(arr[idx], value)
+    series = _players_sorted()[col].iloc[idx]
+    return ufunc(series, value).to_numpy(dtype=bool, na_value=False)
+
+
+# A flattened ``query_players`` filter: (column, operator, value)
+_Condition = Tuple[str, str, Any]
+
+
+def _compile_filters(
+    filters: Dict[str, Any]
+) -> Tuple[Tuple[_Condition, ...], Tuple[_Condition, ...]]:
+    """Flatten ``filters`` into an execution plan for :func:`query_players`.
+
+    Returns:
+        ``(seeds, remaining)``: the equality conditions on indexed
+        columns, answered from the inverted indexes, and the other
+        ``(column, operator, value)`` conditions ordered cheapest and
+        most selective first.
+    """
+    seeds = []
+    remaining = []
+    for col, condition in filters.items():
+        if isinstance(condition, dict):
+            conditions = [(col, op, value) for op, value in condition.items()]
         else:
-            summary["losses"] += 1
-    return summary
+            # Equality check
+            conditions = [(col, "eq", condition)]
+        for cond in conditions:
+            if cond[1] == "eq" and col in _INDEXED_COLUMNS:
+                seeds.append(cond)
+            else:
+                remaining.append(cond)
+    remaining.sort(key=lambda c: _condition_cost(c[1]))
+    return tuple(seeds), tuple(remaining)
+
+
+@functools.lru_cache(maxsize=512)
+def _compiled_plan(frozen: tuple) -> Tuple[Tuple[_Condition, ...], Tuple[_Condition, ...]]:
+    return _compile_filters(
+        {col: {op: v for op, _, v in cond} if is_ops else cond[1] for col, is_ops, cond in frozen}
+    )
+
+
+def _plan_filters(filters: Dict[str, Any]) -> Tuple[Tuple[_Condition, ...], Tuple[_Condition, ...]]:
+    """Return the plan for ``filters``, memoised by a canonical key.
+
+    Values are keyed together with their type, since ``1``, ``1.0`` and
+    ``True`` hash alike.  Filters holding unhashable values (lists,
+    nested dicts) are planned without the cache.
+    """
+    frozen = tuple(
+        (col, True, tuple((op, type(v), v) for op, v in cond.items()))
+        if isinstance(cond, dict)
+        else (col, False, (type(cond), cond))
+        for col, cond in sorted(filters.items(), key=lambda item: str(item[0]))
+    )
+    try:
+        return _compiled_plan(frozen)
+    except TypeError:
+        return _compile_filters(filters)
 
 
 def query_players(
@@ -367,64 +1120,32 @@ def query_players(
         millions), ``total_points``, ``minutes`` and
         ``selected_by_percent``.
     """
-    df = get_elements_df(force_refresh=force_refresh)
-    # Apply filters
-    for col, condition in filters.items():
-        if isinstance(condition, dict):
-            for op, value in condition.items():
-                if op == "eq":
-                    df = df[df[col] == value]
-                elif op == "lt":
-                    df = df[df[col] < value]
-                elif op == "lte":
-                    df = df[df[col] <= value]
-                elif op == "gt":
-                    df = df[df[col] > value]
-                elif op == "gte":
-                    df = df[df[col] >= value]
-                elif op == "contains":
-                    df = df[df[col].astype(str).str.contains(str(value), case=False, na=False)]
-                else:
-                    raise ValueError(f"Unsupported operator: {op}")
+    if force_refresh:
+        get_bootstrap_data(force_refresh=True)
+    df = _players_sorted()
+    seeds, remaining = _plan_filters(filters)
+    # Seed the candidate rows from the inverted indexes for equality
+    # conditions on indexed columns
+    idx: Optional[np.ndarray] = None
+    for col, op, value in seeds:
+        rows = _indexed_rows(col, value)
+        if rows is None:
+            remaining = ((col, op, value),) + remaining
+        elif idx is None:
+            idx = rows
         else:
-            # Equality check
-            df = df[df[col] == condition]
-
-    # Sort by total_points descending then by now_cost ascending
-    if "total_points" in df.columns:
-        df = df.sort_values(by=["total_points", "now_cost"], ascending=[False, True])
-
+            idx = np.intersect1d(idx, rows, assume_unique=True)
+    if idx is None:
+        idx = np.arange(len(df))
+    # Evaluate the other conditions in plan order, each one only over the
+    # rows that survived the previous ones
+    for col, op, value in remaining:
+        idx = idx[_player_mask(col, op, value, idx)]
+        if not len(idx):
+            break
+
+    # Rows are already ordered by total_points descending then by now_cost
+    # ascending, so limiting is a slice
     if top_n is not None:
-        df = df.head(top_n)
-
-    # Select and rename columns for display
-    display_columns = [
-        "id",
-        "first_name",
-        "second_name",
-        "position",
-        "team_name",
-        "now_cost",
-        "total_points",
-        "minutes",
-        "selected_by_percent",
-    ]
-    # Some older seasons may not have selected_by_percent; guard
-    cols_available = [c for c in display_columns if c in df.columns]
-    display_df = df[cols_available].copy()
-    # Convert cost to £m for readability
-    if "now_cost" in display_df.columns:
-        display_df.loc[:, "price_m"] = display_df["now_cost"] / 10.0
-        display_df.drop(columns=["now_cost"], inplace=True)
-        # Move price_m after team_name
-        cols = [
-            "id",
-            "first_name",
-            "second_name",
-            "position",
-            "team_name",
-            "price_m",
-        ] + [c for c in display_df.columns if c not in {"id", "first_name", "second_name", "position", "team_name", "price_m"}]
-        display_df = display_df[cols]
-
-    return display_df.to_string(index=False)
\ No newline at end of file
+        idx = idx[:top_n]
+    return _format_players(_players_display().iloc[idx])
\ No newline at end of file
@@ -15,19 +15,125 @@ Functions:
         Parse a YouTube URL and return the video ID if present.
 
     get_transcript(video_id: str) -> List[str]:
-        Fetch the English transcript for a given YouTube video ID.  If
-        no transcript is available or an error occurs, an empty list
-        is returned.
+        Fetch the English transcript for a given YouTube video ID,
+        cached in memory and on disk.  If no transcript is available or
+        an error occurs, an empty list is returned.
+
+    get_transcript_text(video_id: str, sep: str = "\n") -> str:
+        The same transcript joined into one string.
 
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import gzip
+import json
+import os
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to the stdlib decoder
+    orjson = None
+
+# Directory where downloaded transcripts are saved, one gzipped JSON list
+# of caption lines per video
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "transcripts"
+
+# Shared HTTP session so that the watch page, player API and caption
+# requests for a video (and for later videos) reuse pooled keep-alive
+# connections instead of paying a TLS handshake each time.  Connection
+# failures and 5xx responses are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET", "POST"),
+        ),
+    ),
+)
+
+# Connect and read timeouts for YouTube requests, in seconds
+_TIMEOUT = (3.05, 7)
+
+# Circuit breaker: after this many consecutive failed YouTube requests,
+# downloads are skipped for _BREAKER_COOLDOWN seconds rather than each
+# one stalling on timeouts and retries.
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 60.0
+_FAILURES = 0
+_BREAKER_OPEN_UNTIL = 0.0
+# Requests run on worker threads and concurrent tool calls, so the two
+# counters above are only read and updated under this lock.
+_BREAKER_LOCK = threading.Lock()
+
+
+class _CircuitOpen(Exception):
+    """Raised instead of contacting YouTube while the breaker is open."""
+
+
+def _breaker_open() -> bool:
+    with _BREAKER_LOCK:
+        return time.monotonic() < _BREAKER_OPEN_UNTIL
+
+
+@contextlib.contextmanager
+def _breaker() -> Iterator[None]:
+    """Guard a YouTube request with the circuit breaker.
+
+    Raises ``_CircuitOpen`` while the breaker is open.  A request that
+    raises counts as a failure (malformed caption XML does not), so
+    callers turn non-2xx responses into errors with ``raise_for_status``.
+    Completing does not reset the count; see :func:`_breaker_success`.
+    """
+    global _FAILURES, _BREAKER_OPEN_UNTIL
+    if _breaker_open():
+        raise _CircuitOpen()
+    try:
+        yield
+    except ET.ParseError:
+        raise
+    except Exception:
+        with _BREAKER_LOCK:
+            _FAILURES += 1
+            if _FAILURES >= _BREAKER_THRESHOLD:
+                _BREAKER_OPEN_UNTIL = time.monotonic() + _BREAKER_COOLDOWN
+                _FAILURES = 0
+        raise
+
+
+def _breaker_success() -> None:
+    """Reset the failure count once YouTube has served a usable transcript."""
+    global _FAILURES
+    with _BREAKER_LOCK:
+        _FAILURES = 0
+
+
+# Watch, short-link, embed, Shorts and legacy /v/ URLs, as one pattern so
+# that a URL is scanned once
+_VIDEO_ID_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?v=|embed/|shorts/|v/)|youtu\.be/)([\w-]{11})"
+)
+_API_KEY_RE = re.compile(rb'"INNERTUBE_API_KEY":"([^"]+)"')
+_FMT_SUFFIX_RE = re.compile(r"&fmt=\w+$")
+
 
 def extract_video_id(url: str) -> Optional[str]:
     """Extract the YouTube video ID from a full or shortened URL.
@@ -45,37 +151,221 @@ def extract_video_id(url: str) -> Optional[str]:
         >>> extract_video_id("https://youtu.be/abc123def45")
         'abc123def45'
     """
-    # Patterns to match typical YouTube URL formats
-    patterns = [
-        r"youtube\.com/watch\?v=([\w-]{11})",
-        r"youtu\.be/([\w-]{11})",
-        r"youtube\.com/embed/([\w-]{11})",
-    ]
-    for pat in patterns:
-        match = re.search(pat, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+# The Innertube API key is the same on every watch page for a given
+# client build, so it is scraped once and reused until it expires or the
+# player API rejects it.
+_API_KEY_TTL = 3600.0
+_API_KEY: Optional[str] = None
+_API_KEY_FETCHED = 0.0
+
+# Bytes carried over between watch page chunks so that a key split
+# across two chunks is still found
+_API_KEY_OVERLAP = 256
+
+
+def _cached_api_key() -> Optional[str]:
+    """Return the cached API key if it has not expired."""
+    if _API_KEY is not None and time.monotonic() - _API_KEY_FETCHED < _API_KEY_TTL:
+        return _API_KEY
     return None
 
 
+def _remember_api_key(key: str) -> str:
+    global _API_KEY, _API_KEY_FETCHED
+    _API_KEY, _API_KEY_FETCHED = key, time.monotonic()
+    return key
+
+
+def _forget_api_key() -> None:
+    global _API_KEY
+    _API_KEY = None
+
+
+def _scan_api_key(tail: bytes, chunk: bytes) -> Tuple[Optional[str], bytes]:
+    """Search the next chunk of a watch page for the API key.
+
+    Returns the key (or None) and the bytes to carry into the next call.
+    """
+    data = tail + chunk
+    match = _API_KEY_RE.search(data)
+    if match:
+        return match.group(1).decode(), b""
+    return None, data[-_API_KEY_OVERLAP:]
+
+
 def _get_innertube_api_key(video_id: str) -> Optional[str]:
     """Retrieve the Innertube API key from the video watch page.
 
     The API key is embedded in the page's JavaScript and used to
-    authenticate subsequent API calls.  If the key cannot be found,
-    ``None`` is returned.
+    authenticate subsequent API calls.  The page is streamed and the
+    download stops as soon as the key is seen; the key is then cached
+    for later videos.  If the key cannot be found, ``None`` is returned.
     """
+    key = _cached_api_key()
+    if key is not None:
+        return key
     try:
-        html = requests.get(f"https://www.youtube.com/watch?v={video_id}", timeout=10).text
-        match = re.search(r'"INNERTUBE_API_KEY":"([^\"]+)"', html)
-        return match.group(1) if match else None
+        url = f"https://www.youtube.com/watch?v={video_id}"
+        with _breaker(), _SESSION.get(url, timeout=_TIMEOUT, stream=True) as resp:
+            resp.raise_for_status()
+            tail = b""
+            for chunk in resp.iter_content(chunk_size=16384):
+                key, tail = _scan_api_key(tail, chunk)
+                if key is not None:
+                    return _remember_api_key(key)
     except Exception:
+        pass
+    return None
+
+
+# Caption endpoint the YouTube player itself loads.  Auto-generated
+# English captions can usually be fetched from it directly by video id.
+_TIMEDTEXT_URL = "https://www.youtube.com/api/timedtext"
+
+
+def _timedtext_params(video_id: str) -> Dict[str, str]:
+    """Return the query for a video's auto-generated English captions."""
+    return {"lang": "en", "v": video_id, "kind": "asr", "fmt": "srv1"}
+
+
+def _try_direct_timedtext(video_id: str) -> List[str]:
+    """Fetch the auto-generated English captions in a single request.
+
+    Returns an empty list if the endpoint has nothing for the video (it
+    answers with an empty body when the request is not signed), in which
+    case the caller falls back to the Innertube player API.  Error
+    responses count towards the circuit breaker, but since this is only
+    a probe a success here never resets it.
+    """
+    try:
+        with _breaker(), _SESSION.get(
+            _TIMEDTEXT_URL, params=_timedtext_params(video_id), timeout=_TIMEOUT, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            return _caption_lines(resp.raw)
+    except Exception:
+        return []
+
+
+# Player responses larger than this are abandoned rather than parsed; a
+# normal one is well under a megabyte
+_MAX_PLAYER_BYTES = 8 * 1024 * 1024
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON body."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _too_large(content_length: Optional[str]) -> bool:
+    """Return True if a declared body size exceeds ``_MAX_PLAYER_BYTES``."""
+    return content_length is not None and content_length.isdigit() and (
+        int(content_length) > _MAX_PLAYER_BYTES
+    )
+
+
+def _read_player_response(resp: requests.Response) -> Optional[bytes]:
+    """Read a streamed player response, or return None if it is too large."""
+    if _too_large(resp.headers.get("Content-Length")):
         return None
+    body = bytearray()
+    for chunk in resp.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) > _MAX_PLAYER_BYTES:
+            return None
+    return bytes(body)
+
+
+def _player_request(api_key: str, video_id: str) -> Tuple[str, Dict[str, Any]]:
+    """Return the Innertube player API URL and JSON body for a video."""
+    url = f"https://www.youtube.com/youtubei/v1/player?key={api_key}"
+    body = {
+        "context": {
+            "client": {
+                "clientName": "ANDROID",
+                "clientVersion": "20.10.38",
+            }
+        },
+        "videoId": video_id,
+    }
+    return url, body
+
+
+def _caption_track_url(data: Dict[str, Any]) -> Optional[str]:
+    """Return the XML caption URL of the English track in a player response."""
+    # Traverse the captions object to find the English track
+    try:
+        tracks = data["captions"]["playerCaptionsTracklistRenderer"]["captionTracks"]
+    except (KeyError, TypeError):
+        return None
+    track = next((t for t in tracks if t.get("languageCode") == "en"), None)
+    if not track:
+        return None
+    base_url = track.get("baseUrl")
+    if not base_url:
+        return None
+    # Remove fmt parameter if present to get XML
+    return _FMT_SUFFIX_RE.sub("", base_url)
+
+
+def _cache_path(video_id: str) -> Path:
+    return CACHE_DIR / f"{video_id}.json.gz"
+
+
+def _read_cached_transcript(video_id: str) -> Optional[List[str]]:
+    """Return the transcript saved on disk for ``video_id``, if any."""
+    try:
+        return _loads(gzip.decompress(_cache_path(video_id).read_bytes()))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_transcript(video_id: str, lines: List[str]) -> None:
+    """Save a transcript to disk; failures only cost a later re-download."""
+    raw = orjson.dumps(lines) if orjson is not None else json.dumps(lines).encode()
+    path = _cache_path(video_id)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(gzip.compress(raw, compresslevel=6))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_transcript(video_id: str) -> Tuple[str, ...]:
+    """Return a transcript from disk or the network, memoised per video.
+
+    An empty result usually means a transient failure, so it raises
+    ``LookupError`` instead of being cached at either level.
+    """
+    lines = _read_cached_transcript(video_id)
+    if lines is None:
+        lines = _download_transcript(video_id)
+        if not lines:
+            raise LookupError(video_id)
+        _write_cached_transcript(video_id, lines)
+    return tuple(lines)
+
+
+def clear_transcript_cache() -> None:
+    """Drop the in-memory transcripts; files under ``CACHE_DIR`` are kept."""
+    _cached_transcript.cache_clear()
 
 
 def get_transcript(video_id: str) -> List[str]:
     """Download the English transcript for a YouTube video.
 
+    Transcripts do not change once published, so they are kept in
+    memory and saved under ``CACHE_DIR``; only the first request for a
+    video goes to YouTube.
+
     Args:
         video_id: The 11‑character YouTube video ID.
 
@@ -84,47 +374,92 @@ def get_transcript(video_id: str) -> List[str]:
         transcript is unavailable or an error occurs, an empty list
         is returned.
     """
+    try:
+        return list(_cached_transcript(video_id))
+    except LookupError:
+        return []
+
+
+def get_transcript_text(video_id: str, sep: str = "\n") -> str:
+    """Return the English transcript for a video as a single string.
+
+    Joins the cached caption lines directly, without the list copy that
+    :func:`get_transcript` hands out.
+
+    Args:
+        video_id: The 11‑character YouTube video ID.
+        sep: Separator placed between caption lines.
+
+    Returns:
+        The transcript text, or an empty string if the transcript is
+        unavailable or an error occurs.
+    """
+    try:
+        return sep.join(_cached_transcript(video_id))
+    except LookupError:
+        return ""
+
+
+def _download_transcript(video_id: str) -> List[str]:
+    """Fetch a transcript from YouTube, bypassing the caches."""
+    if _breaker_open():
+        return []
+    lines = _try_direct_timedtext(video_id)
+    if lines:
+        return lines
     api_key = _get_innertube_api_key(video_id)
     if not api_key:
         return []
-    url = f"https://www.youtube.com/youtubei/v1/player?key={api_key}"
-    body = {
-        "context": {
-            "client": {
-                "clientName": "ANDROID",
-                "clientVersion": "20.10.38",
-            }
-        },
-        "videoId": video_id,
-    }
+    url, body = _player_request(api_key, video_id)
     try:
-        resp = requests.post(url, json=body, timeout=10)
-        data = resp.json()
+        with _breaker(), _SESSION.post(
+            url, json=body, timeout=_TIMEOUT, stream=True
+        ) as resp:
+            if not resp.ok:
+                # Possibly an expired key; scrape a fresh one next time
+                _forget_api_key()
+            resp.raise_for_status()
+            raw = _read_player_response(resp)
+        if raw is None:
+            return []
+        data = _loads(raw)
     except Exception:
         return []
-    # Traverse the captions object to find the English track
-    captions = (
-        data
-        .get("captions", {})
-        .get("playerCaptionsTracklistRenderer", {})
-        .get("captionTracks", [])
-    )
-    track = None
-    for t in captions:
-        if t.get("languageCode") == "en":
-            track = t
-            break
-    if not track:
-        return []
-    base_url = track.get("baseUrl")
+    base_url = _caption_track_url(data)
     if not base_url:
         return []
-    # Remove fmt parameter if present to get XML
-    base_url = re.sub(r"&fmt=\w+$", "", base_url)
     try:
-        xml_text = requests.get(base_url, timeout=10).text
-        root = ET.fromstring(xml_text)
-        captions = [item.text or "" for item in root.findall("text")]
-        return captions
+        with _breaker(), _SESSION.get(base_url, timeout=_TIMEOUT, stream=True) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            lines = _caption_lines(resp.raw)
     except Exception:
-        return []
\ No newline at end of file
+        return []
+    if lines:
+        _breaker_success()
+    return lines
+
+
+def _caption_lines(source: BinaryIO) -> List[str]:
+    """Collect the ``<text>`` captions from a timedtext XML stream.
+
+    The document is parsed incrementally and each caption is dropped from
+    the tree once read, so neither the whole body nor the whole tree is
+    held in memory.  Equivalent to ``[t.text or "" for t in
+    root.findall("text")]``.
+    """
+    lines: List[str] = []
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            if elem.tag == "text":
+                lines.append(elem.text or "")
+            root.clear()
+    return lines
\ No newline at end of file